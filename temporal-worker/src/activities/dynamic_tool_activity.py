@@ -26,6 +26,10 @@ async def _get_tool_handler(tool_name: str) -> Optional[Callable]:
         from src.tools.arxiv_client_mcp import arxiv_download_paper
         return arxiv_download_paper
     
+    elif tool_name == "arxiv_download_papers":
+        from src.tools.arxiv_client_mcp import arxiv_download_papers
+        return arxiv_download_papers
+    
     elif tool_name == "arxiv_list_papers":
         from src.tools.arxiv_client_mcp import arxiv_list_papers
         return arxiv_list_papers
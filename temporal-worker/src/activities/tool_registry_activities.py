@@ -30,6 +30,15 @@ TOOL_DESCRIPTIONS = {
         },
         "returns": "Download status and local file information"
     },
+    "arxiv_download_papers": {
+        "description": "Download and locally store several arXiv papers concurrently",
+        "args": {
+            "paper_ids": "List of arXiv paper IDs (required)",
+            "force_download": "Optional: Force re-download if already exists (default: false)",
+            "concurrency": "Optional: Maximum simultaneous downloads (default: 8)"
+        },
+        "returns": "Per-paper download status and local file information"
+    },
     "arxiv_list_papers": {
         "description": "List all locally downloaded papers with filtering options",
         "args": {
@@ -69,7 +78,8 @@ TOOL_DESCRIPTIONS = {
         "args": {
             "paper_text": "Optional: Full text of the paper (provide either this or paper_url)",
             "paper_url": "Optional: URL to paper PDF (provide either this or paper_text)",
-            "format": "Optional: Citation format to expect (default: mixed)"
+            "format": "Optional: Citation format to expect (default: mixed)",
+            "known_authors": "Optional: Author names to detect in the text"
         },
         "returns": "List of extracted citations with parsed metadata"
     },
@@ -4,17 +4,26 @@ Replaces custom implementation with actual JSON-RPC communication.
 """
 
 import asyncio
+import copy
 import json
+import mmap
 import os
 import subprocess
 import logging
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Real ArXiv API integration
 import arxiv
 
+try:
+    # POSIX only; elsewhere index saves still merge, just without the lock
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Imports needed for test patching compatibility
 import requests
 try:
@@ -22,6 +31,54 @@ try:
 except ImportError:
     from citation_analyzer import extract_citations
 
+# Prefer orjson for metadata/index I/O; its JSONDecodeError subclasses
+# json.JSONDecodeError, so existing error handling applies to both
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: Any) -> Any:
+        # json.loads takes bytes/str but not the memoryviews _read_json passes
+        return json.loads(data if isinstance(data, (bytes, str)) else bytes(data))
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, mapping it instead of copying it when over a page."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _json_loads(view)
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """
+    Write a JSON file atomically.
+    
+    Readers may hold the old file mapped by _read_json, and truncating it in
+    place under them raises SIGBUS, so the data goes to a temp file that
+    replaces the original in one rename.
+    """
+    # Per-process temp name so workers sharing the storage directory never
+    # write into each other's half-finished file before the rename
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(obj))
+    os.replace(tmp_file, path)
+
+
+# Parsed papers indexes keyed by file path, tagged with (st_mtime_ns, st_size)
+# so clients sharing a storage directory skip re-parsing an unchanged file
+_INDEX_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 class ArxivMCPServerClient:
     """Client for communicating with arxiv-mcp-server via JSON-RPC."""
@@ -36,6 +93,11 @@ class ArxivMCPServerClient:
         
         # Initialize papers index for tracking downloaded papers
         self._papers_index = {}
+        # Paper ids as of the last load or save, to tell local removals apart
+        # from entries other clients added since
+        self._synced_ids: frozenset = frozenset()
+        # (st_mtime_ns, st_size) of the index file as of that load or save
+        self._synced_stat: Optional[Tuple[int, int]] = None
         self.papers_index_file = self.storage_path / "papers_index.json"
         
         # Load existing index if it exists
@@ -45,6 +107,11 @@ class ArxivMCPServerClient:
         self.server_process: Optional[asyncio.subprocess.Process] = None
         self.request_id = 0
         self.initialized = False
+        # Requests share the stdio pipe: writes go out one at a time, and a
+        # single reader task hands each response to the future for its id
+        self._write_lock = asyncio.Lock()
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
     
     @property
     def papers_index(self) -> Dict[str, Any]:
@@ -65,11 +132,22 @@ class ArxivMCPServerClient:
         return self.storage_path / f"{paper_id}_metadata.json"
     
     def _load_papers_index(self) -> None:
-        """Load papers index from disk."""
+        """Load papers index from disk, reusing the cached parse if unchanged."""
         if self.papers_index_file.exists():
             try:
-                with open(self.papers_index_file, 'r') as f:
-                    self._papers_index = json.load(f)
+                stat = self.papers_index_file.stat()
+                cached = _INDEX_CACHE.get(self.papers_index_file)
+                if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    self._papers_index = copy.deepcopy(cached[2])
+                else:
+                    self._papers_index = _read_json(self.papers_index_file)
+                    _INDEX_CACHE[self.papers_index_file] = (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        copy.deepcopy(self._papers_index),
+                    )
+                self._synced_ids = frozenset(self._papers_index)
+                self._synced_stat = (stat.st_mtime_ns, stat.st_size)
             except (json.JSONDecodeError, IOError):
                 # If index is corrupted, start fresh
                 self._papers_index = {}
@@ -79,10 +157,60 @@ class ArxivMCPServerClient:
             self._save_papers_index()
     
     def _save_papers_index(self) -> None:
-        """Save papers index to disk."""
+        """
+        Save papers index to disk, merged with what other clients saved.
+        
+        Holds an exclusive lock on a sidecar lock file while it folds this
+        client's additions and removals into the on-disk index and atomically
+        replaces the file, so concurrent savers never drop each other's
+        entries. The on-disk index is only merged in when another writer has
+        changed it, and only re-parsed when the shared cache is stale.
+        """
+        lock_file = self.papers_index_file.with_name(
+            f"{self.papers_index_file.name}.lock"
+        )
         try:
-            with open(self.papers_index_file, 'w') as f:
-                json.dump(self._papers_index, f, indent=2)
+            with open(lock_file, 'a') as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                
+                try:
+                    stat = self.papers_index_file.stat()
+                    disk_stat = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    disk_stat = None
+                
+                if disk_stat is not None and disk_stat != self._synced_stat:
+                    cached = _INDEX_CACHE.get(self.papers_index_file)
+                    if cached and cached[:2] == disk_stat:
+                        on_disk = cached[2]
+                    else:
+                        try:
+                            on_disk = _read_json(self.papers_index_file)
+                        except (ValueError, OSError):
+                            on_disk = {}
+                    if not isinstance(on_disk, dict):
+                        on_disk = {}
+                    
+                    removed = self._synced_ids - self._papers_index.keys()
+                    merged = {
+                        paper_id: data for paper_id, data in on_disk.items()
+                        if paper_id not in removed
+                    }
+                    merged.update(self._papers_index)
+                else:
+                    # Nobody else wrote since this client last synced
+                    merged = self._papers_index
+                
+                _write_json(self.papers_index_file, merged)
+                self._papers_index = merged
+                
+                stat = self.papers_index_file.stat()
+                _INDEX_CACHE[self.papers_index_file] = (
+                    stat.st_mtime_ns, stat.st_size, copy.deepcopy(merged)
+                )
+                self._synced_ids = frozenset(merged)
+                self._synced_stat = (stat.st_mtime_ns, stat.st_size)
         except IOError:
             # If we can't save, continue without failing
             pass
@@ -146,19 +274,58 @@ class ArxivMCPServerClient:
         if not self.server_process:
             raise RuntimeError("Server process not started")
         
-        request_json = json.dumps(request) + "\n"
-        self.server_process.stdin.write(request_json.encode())
-        await self.server_process.stdin.drain()
-        
-        # Read response
-        response_line = await self.server_process.stdout.readline()
-        if not response_line:
-            raise RuntimeError("No response from MCP server")
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._read_responses())
         
+        request_id = request.get("id")
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
         try:
-            return json.loads(response_line.decode().strip())
-        except json.JSONDecodeError:
-            raise RuntimeError(f"Invalid JSON response: {response_line.decode()}")
+            request_json = json.dumps(request) + "\n"
+            async with self._write_lock:
+                self.server_process.stdin.write(request_json.encode())
+                await self.server_process.stdin.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+    
+    async def _read_responses(self) -> None:
+        """Resolve pending requests from server output, matching on JSON-RPC id."""
+        error = RuntimeError("No response from MCP server")
+        try:
+            while True:
+                response_line = await self.server_process.stdout.readline()
+                if not response_line:
+                    break
+                line = response_line.decode().strip()
+                
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    # Can't tell whose answer this was, so fail everyone waiting
+                    self._fail_pending(
+                        RuntimeError(f"Invalid JSON response: {line}")
+                    )
+                    continue
+                
+                future = None
+                if isinstance(response, dict):
+                    future = self._pending.get(response.get("id"))
+                if future is None or future.done():
+                    # Server notifications and answers nobody is waiting for
+                    logging.debug(f"Skipping unrelated MCP message: {line}")
+                    continue
+                future.set_result(response)
+        except Exception as e:
+            error = RuntimeError(f"Lost connection to MCP server: {e}")
+        finally:
+            self._fail_pending(error)
+    
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every request still waiting for a response."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
     
     async def _send_notification(self, notification: Dict[str, Any]) -> None:
         """Send a JSON-RPC notification (no response expected)."""
@@ -166,8 +333,9 @@ class ArxivMCPServerClient:
             raise RuntimeError("Server process not started")
         
         notification_json = json.dumps(notification) + "\n"
-        self.server_process.stdin.write(notification_json.encode())
-        await self.server_process.stdin.drain()
+        async with self._write_lock:
+            self.server_process.stdin.write(notification_json.encode())
+            await self.server_process.stdin.drain()
     
     def _next_id(self) -> int:
         """Get the next request ID."""
@@ -288,6 +456,14 @@ class ArxivMCPServerClient:
     
     async def stop_server(self) -> None:
         """Stop the MCP server process."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        
         if self.server_process:
             self.server_process.terminate()
             try:
@@ -312,27 +488,33 @@ class ArxivMCPServerClient:
 # Global MCP client instance
 _mcp_client: Optional[ArxivMCPServerClient] = None
 mcp_client: Optional[ArxivMCPServerClient] = None  # For test compatibility
+_mcp_client_lock: Optional[asyncio.Lock] = None
 
 
 async def get_mcp_client() -> ArxivMCPServerClient:
     """Get or create the global MCP client instance."""
-    global _mcp_client
+    global _mcp_client, _mcp_client_lock
+    
+    if _mcp_client_lock is None:
+        _mcp_client_lock = asyncio.Lock()
     
-    if _mcp_client is None:
-        _mcp_client = ArxivMCPServerClient()
-        await _mcp_client.start_server()
+    async with _mcp_client_lock:
+        if _mcp_client is None:
+            client = ArxivMCPServerClient()
+            try:
+                await client.start_server()
+            finally:
+                # Published only once startup has settled; concurrent callers
+                # wait on the lock instead of seeing a half-started client
+                _mcp_client = client
     
     return _mcp_client
 
 
 async def ensure_mcp_server_available() -> bool:
     """Ensure the MCP server is available."""
-    global _mcp_client
-    
     try:
-        if _mcp_client is None:
-            _mcp_client = ArxivMCPServerClient()
-            await _mcp_client.start_server()
+        await get_mcp_client()
         return True
     except Exception as e:
         logging.warning(f"MCP server not available: {e}. Will use ArXiv API fallback.")
@@ -581,8 +763,7 @@ async def arxiv_download_paper(args: Dict[str, Any]) -> Dict[str, Any]:
                         "authors": ["Test Author"],
                         "abstract": "Test abstract"
                     }
-                with open(metadata_file, 'w') as f:
-                    json.dump(fake_metadata, f)
+                _write_json(metadata_file, fake_metadata)
             
             return {
                 "success": True,
@@ -602,6 +783,79 @@ async def arxiv_download_paper(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+async def arxiv_download_papers(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Download several arXiv papers concurrently.
+    
+    Args:
+        args: Dictionary containing:
+            - paper_ids: List of arXiv paper IDs
+            - force_download: Force re-download if already exists
+            - concurrency: Maximum downloads in flight (default: 8)
+            
+    Returns:
+        Per-paper download results in input order
+    """
+    
+    paper_ids = args.get("paper_ids", [])
+    force_download = args.get("force_download", False)
+    
+    if not isinstance(paper_ids, list):
+        return {
+            "success": False,
+            "error": "paper_ids must be a list of paper IDs",
+            "results": []
+        }
+    
+    if not paper_ids:
+        return {
+            "success": False,
+            "error": "At least one paper ID is required",
+            "results": []
+        }
+    
+    try:
+        concurrency = args.get("concurrency")
+        concurrency = 8 if concurrency is None else max(1, int(concurrency))
+    except (TypeError, ValueError):
+        return {
+            "success": False,
+            "error": f"Invalid concurrency: {args.get('concurrency')!r}",
+            "results": []
+        }
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _download_one(paper_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await arxiv_download_paper({
+                "paper_id": paper_id,
+                "force_download": force_download
+            })
+    
+    outcomes = await asyncio.gather(
+        *(_download_one(paper_id) for paper_id in paper_ids),
+        return_exceptions=True
+    )
+    
+    results = []
+    for paper_id, outcome in zip(paper_ids, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = {
+                "success": False,
+                "error": f"Download failed: {str(outcome)}",
+                "paper_id": paper_id
+            }
+        results.append(outcome)
+    
+    return {
+        "success": True,
+        "results": results,
+        "count": len(results),
+        "downloaded": sum(1 for r in results if r.get("success"))
+    }
+
+
 async def arxiv_list_papers(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     List all locally downloaded papers using arxiv-mcp-server.
@@ -636,10 +890,29 @@ async def arxiv_list_papers(args: Dict[str, Any]) -> Dict[str, Any]:
         if hasattr(client, 'server_process') and client.initialized:
             result = await client.list_papers()
             papers = result.get("papers", [])
+            
+            # Apply filters
+            if category_filter:
+                papers = [
+                    p for p in papers if category_filter in p.get("categories", [])
+                ]
+            
+            # Apply limit
+            if limit and len(papers) > limit:
+                papers = papers[:limit]
         else:
+            # Filter and limit on the raw index first so only returned papers
+            # pay for building an entry and stat()ing their metadata file
+            matches = (
+                (paper_id, data) for paper_id, data in client.papers_index.items()
+                if not category_filter or category_filter in data.get("categories", [])
+            )
+            if limit and limit > 0:
+                matches = islice(matches, limit)
+            
             # Use local papers index
             papers = []
-            for paper_id, data in client.papers_index.items():
+            for paper_id, data in matches:
                 paper_data = {
                     "id": paper_id,
                     "title": data.get("title", ""),
@@ -651,14 +924,6 @@ async def arxiv_list_papers(args: Dict[str, Any]) -> Dict[str, Any]:
                 }
                 papers.append(paper_data)
         
-        # Apply filters
-        if category_filter:
-            papers = [p for p in papers if category_filter in p.get("categories", [])]
-        
-        # Apply limit
-        if limit and len(papers) > limit:
-            papers = papers[:limit]
-        
         return {
             "success": True,
             "papers": papers,
@@ -752,8 +1017,7 @@ async def arxiv_read_paper(args: Dict[str, Any]) -> Dict[str, Any]:
             # Load metadata if requested and available
             if include_metadata and metadata_file.exists():
                 try:
-                    with open(metadata_file, 'r') as f:
-                        response["metadata"] = json.load(f)
+                    response["metadata"] = _read_json(metadata_file)
                 except (json.JSONDecodeError, IOError):
                     response["metadata"] = {}
         
@@ -812,8 +1076,7 @@ async def arxiv_get_paper_metadata(args: Dict[str, Any]) -> Dict[str, Any]:
         metadata_file = client._get_metadata_file_path(paper_id)
         if metadata_file.exists():
             try:
-                with open(metadata_file, 'r') as f:
-                    paper_metadata = json.load(f)
+                paper_metadata = _read_json(metadata_file)
                 # Normalize the ID to remove version numbers for test compatibility
                 if "id" in paper_metadata and paper_metadata["id"].startswith(paper_id):
                     paper_metadata["id"] = paper_id
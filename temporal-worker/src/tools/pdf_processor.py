@@ -5,11 +5,53 @@ Extracts text, sections, and metadata from research papers.
 
 import io
 import re
-from typing import Any, Dict, List 
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pdfplumber
 import requests
 
+# Header aliases for the common academic sections, and whether the header may
+# carry a section number ("2. Methods")
+_SECTION_ALIASES = {
+    "abstract": (("abstract", "summary"), False),
+    "introduction": (("introduction", "background"), True),
+    "methodology": (("methodology", "methods", "approach"), True),
+    "results": (("results", "findings", "experiments"), True),
+    "conclusion": (("conclusion", "conclusions", "discussion"), True),
+    "references": (("references", "bibliography", "work cited", "works cited"), False),
+}
+
+# Requested section name variants -> canonical _SECTION_ALIASES key
+_SECTION_NAMES = {
+    "abstract": "abstract",
+    "intro": "introduction",
+    "introduction": "introduction",
+    "method": "methodology",
+    "methods": "methodology",
+    "methodology": "methodology",
+    "result": "results",
+    "results": "results",
+    "conclusion": "conclusion",
+    "conclusions": "conclusion",
+    "references": "references",
+    "bibliography": "references",
+}
+
+# Section body cleanup, applied to every extracted section
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+_INLINE_SPACE_RE = re.compile(r'[ \t]+')
+
+# Fixups for _clean_extracted_text, tried left to right in one pass. Page
+# markers absorb the whitespace before them (backtracking \s* to a line start)
+_CLEAN_RE = re.compile(
+    r"(?P<hyphen>(?<=\w)-[ \t]*\n\s*(?=\w))"           # Fix hyphenated words
+    r"|(?P<page>\s*^[ \t]*Page\s+\d+[^\n]*)"            # Page N headers/footers
+    r"|(?P<number>\s*^[ \t]*\d+[ \t]*$)"                # Bare page numbers
+    r"|(?P<ws>\s+)",                                  # Excessive whitespace
+    re.IGNORECASE | re.MULTILINE
+)
+
 
 async def process_pdf_content(args: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -18,7 +60,7 @@ async def process_pdf_content(args: Dict[str, Any]) -> Dict[str, Any]:
     Args:
         args: Dictionary containing:
             - pdf_url: URL to PDF file
-            - sections: Optional list of sections to extract
+            - sections: Optional list of sections to extract (False to skip)
             - include_metadata: Include PDF metadata
             
     Returns:
@@ -53,34 +95,39 @@ async def process_pdf_content(args: Dict[str, Any]) -> Dict[str, Any]:
         
         with pdfplumber.open(pdf_content) as pdf:
             # Extract metadata if requested
-            if include_metadata and pdf.metadata:
+            # (checked first so pdf.metadata is never parsed when not wanted)
+            pdf_metadata = pdf.metadata if include_metadata else None
+            if pdf_metadata:
                 extracted_content["metadata"] = {
-                    "title": pdf.metadata.get("Title", ""),
-                    "author": pdf.metadata.get("Author", ""),
-                    "subject": pdf.metadata.get("Subject", ""),
-                    "creator": pdf.metadata.get("Creator", ""),
+                    "title": pdf_metadata.get("Title", ""),
+                    "author": pdf_metadata.get("Author", ""),
+                    "subject": pdf_metadata.get("Subject", ""),
+                    "creator": pdf_metadata.get("Creator", ""),
                     "pages": len(pdf.pages)
                 }
             
-            # Extract text from each page
-            full_text = ""
+            # Extract text from each page, streaming it into one buffer
+            text_buffer = io.StringIO()
             for page_num, page in enumerate(pdf.pages):
                 page_text = page.extract_text()
                 if page_text:
-                    full_text += page_text + "\n"
+                    text_buffer.write(page_text)
+                    text_buffer.write("\n")
                     extracted_content["pages"].append({
                         "page_number": page_num + 1,
                         "text": page_text,
                         "char_count": len(page_text)
                     })
             
+            full_text = text_buffer.getvalue()
             extracted_content["full_text"] = full_text
             
-            # Extract specific sections if requested
+            # Extract specific sections if requested; sections=False skips
+            # section extraction for callers that only want the raw text
             if target_sections:
                 sections = _extract_paper_sections(full_text, target_sections)
                 extracted_content["sections"] = sections
-            else:
+            elif target_sections is not False:
                 # Extract common academic sections
                 common_sections = ["abstract", "introduction", "methodology", "results", "conclusion", "references"]
                 sections = _extract_paper_sections(full_text, common_sections)
@@ -172,49 +219,22 @@ def _extract_paper_sections(
     
     sections = {}
     
-    # Common section header patterns
-    if strict_matching:
-        # Strict matching - exact section names
-        section_patterns = {
-            section.lower(): rf"^{re.escape(section)}\s*$"
-            for section in target_sections
-        }
-    else:
-        # Flexible matching - partial matches and variations
-        section_patterns = {}
-        for section in target_sections:
-            section_lower = section.lower()
-            if section_lower == "abstract":
-                section_patterns["abstract"] = r"(?:^|\n)\s*(?:abstract|summary)\s*(?:\n|$)"
-            elif section_lower == "introduction":
-                section_patterns["introduction"] = r"(?:^|\n)\s*(?:\d+\.?\s*)?(?:introduction|background)\s*(?:\n|$)"
-            elif section_lower in ["methodology", "methods"]:
-                section_patterns["methodology"] = r"(?:^|\n)\s*(?:\d+\.?\s*)?(?:methodology|methods|approach)\s*(?:\n|$)"
-            elif section_lower == "results":
-                section_patterns["results"] = r"(?:^|\n)\s*(?:\d+\.?\s*)?(?:results|findings|experiments)\s*(?:\n|$)"
-            elif section_lower == "conclusion":
-                section_patterns["conclusion"] = r"(?:^|\n)\s*(?:\d+\.?\s*)?(?:conclusion|conclusions|discussion)\s*(?:\n|$)"
-            elif section_lower == "references":
-                section_patterns["references"] = r"(?:^|\n)\s*(?:references|bibliography|works?\s+cited)\s*(?:\n|$)"
-            else:
-                # Generic pattern for other sections
-                section_patterns[section_lower] = rf"(?:^|\n)\s*(?:\d+\.?\s*)?{re.escape(section_lower)}\s*(?:\n|$)"
+    section_regex, section_names = _compile_section_regex(
+        tuple(target_sections), strict_matching
+    )
+    if section_regex is None:
+        return sections
     
-    # Find section boundaries
-    section_positions = []
-    
-    for section_name, pattern in section_patterns.items():
-        matches = list(re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE))
-        for match in matches:
-            section_positions.append({
-                "name": section_name,
-                "start": match.end(),
-                "header_start": match.start(),
-                "header_text": match.group().strip()
-            })
-    
-    # Sort sections by position
-    section_positions.sort(key=lambda x: x["start"])
+    # Find section boundaries in a single pass; each alternative is named s<i>
+    section_positions = [
+        {
+            "name": section_names[int(match.lastgroup[1:])],
+            "start": match.end(),
+            "header_start": match.start(),
+            "header_text": match.group().strip()
+        }
+        for match in section_regex.finditer(text)
+    ]
     
     # Extract content between sections
     for i, section in enumerate(section_positions):
@@ -230,8 +250,8 @@ def _extract_paper_sections(
         section_content = text[start_pos:end_pos].strip()
         
         # Clean up content (remove excessive whitespace, etc.)
-        section_content = re.sub(r'\n\s*\n\s*\n', '\n\n', section_content)
-        section_content = re.sub(r'[ \t]+', ' ', section_content)
+        section_content = _BLANK_LINES_RE.sub('\n\n', section_content)
+        section_content = _INLINE_SPACE_RE.sub(' ', section_content)
         
         if section_content:
             sections[section["name"]] = {
@@ -244,18 +264,99 @@ def _extract_paper_sections(
     return sections
 
 
-def _clean_extracted_text(text: str) -> str:
-    """Clean and normalize extracted text."""
+@lru_cache(maxsize=64)
+def _compile_section_regex(
+    target_sections: Tuple[str, ...],
+    strict_matching: bool
+) -> Tuple[Optional[re.Pattern], Tuple[str, ...]]:
+    """
+    Compile the header patterns for the requested sections into one regex.
     
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    Args:
+        target_sections: Section names to find
+        strict_matching: Use strict header matching
+        
+    Returns:
+        Fused pattern (None if no sections) and the section name for each
+        alternative, in order
+    """
     
-    # Fix common PDF extraction issues
-    text = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', text)  # Fix hyphenated words
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Normalize paragraph breaks
+    # Common section header patterns
+    if strict_matching:
+        # Strict matching - exact section names
+        section_patterns = {
+            section.lower(): rf"^{re.escape(section)}\s*$"
+            for section in target_sections
+        }
+    else:
+        # Flexible matching - partial matches and variations
+        section_patterns = {}
+        for section in target_sections:
+            section_lower = section.lower()
+            section_key = _SECTION_NAMES.get(section_lower, section_lower)
+            if section_key in _SECTION_ALIASES:
+                aliases, numbered = _SECTION_ALIASES[section_key]
+                number = r"(?:\d+\.?\s*)?" if numbered else ""
+                alternation = _trie_pattern(aliases)
+                section_patterns[section_key] = (
+                    rf"(?:^|\n)\s*{number}(?:{alternation})\s*(?:\n|$)"
+                )
+            else:
+                # Generic pattern for other sections
+                section_patterns[section_lower] = rf"(?:^|\n)\s*(?:\d+\.?\s*)?{re.escape(section_lower)}\s*(?:\n|$)"
     
-    # Remove page numbers and headers/footers (basic patterns)
-    text = re.sub(r'\n\s*\d+\s*\n', '\n', text)  # Page numbers
-    text = re.sub(r'\n\s*Page\s+\d+.*?\n', '\n', text, flags=re.IGNORECASE)
+    if not section_patterns:
+        return None, ()
     
-    return text.strip()
\ No newline at end of file
+    # Alternatives go in reverse so that when one header matches several
+    # sections (e.g. "Background" for introduction and background), the
+    # later-requested section claims it
+    names = tuple(reversed(section_patterns))
+    fused = "|".join(
+        f"(?P<s{i}>{section_patterns[name]})" for i, name in enumerate(names)
+    )
+    return re.compile(fused, re.IGNORECASE | re.MULTILINE), names
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of words with shared prefixes factored out.
+    
+    E.g. ["methodology", "methods", "approach"] -> "(?:approach|method(?:ology|s))",
+    so the engine walks each common prefix once instead of retrying it per word.
+    A space in a word matches any run of whitespace.
+    """
+    
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of word
+    
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" not in node:
+            return body
+        # A word ends here, so the rest is optional
+        return f"{body}?" if len(branches) > 1 or len(body) == 1 else f"(?:{body})?"
+    
+    return emit(trie)
+
+
+def _clean_extracted_text(text: str) -> str:
+    """Clean and normalize extracted text."""
+    
+    # One scan: join hyphen-broken words, drop page markers, collapse whitespace
+    return _CLEAN_RE.sub(_clean_replacement, text).strip()
+
+
+def _clean_replacement(match: re.Match) -> str:
+    """Replacement for each _CLEAN_RE fixup; only whitespace survives, as one space."""
+    return " " if match.lastgroup == "ws" else ""
@@ -5,14 +5,14 @@ Provides discovery, validation, and execution of research tools.
 Enhanced with MCP-based arXiv tools for improved performance and local storage.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from temporalio import activity
 
 # Enhanced arXiv tools with MCP server
 from .arxiv_client_mcp import (
-    arxiv_search_papers, arxiv_download_paper, arxiv_list_papers, 
-    arxiv_read_paper, arxiv_get_paper_metadata, arxiv_deep_analysis
+    arxiv_search_papers, arxiv_download_paper, arxiv_download_papers,
+    arxiv_list_papers, arxiv_read_paper, arxiv_get_paper_metadata, arxiv_deep_analysis
 )
 
 # Other research tools
@@ -26,6 +26,7 @@ TOOL_REGISTRY: Dict[str, Callable] = {
     # Enhanced arXiv tools with MCP server
     "arxiv_search_papers": arxiv_search_papers,
     "arxiv_download_paper": arxiv_download_paper,
+    "arxiv_download_papers": arxiv_download_papers,
     "arxiv_list_papers": arxiv_list_papers,
     "arxiv_read_paper": arxiv_read_paper,
     "arxiv_get_metadata": arxiv_get_paper_metadata,
@@ -63,6 +64,17 @@ TOOL_DESCRIPTIONS = {
         },
         "returns": "Download status and local file information"
     },
+    "arxiv_download_papers": {
+        "description": "Download and locally store several arXiv papers concurrently",
+        "args": {
+            "paper_ids": "List of arXiv paper IDs",
+            "force_download": (
+                "Optional: Force re-download if already exists (default: false)"
+            ),
+            "concurrency": "Optional: Maximum simultaneous downloads (default: 8)"
+        },
+        "returns": "Per-paper download status and local file information"
+    },
     "arxiv_list_papers": {
         "description": "List all locally downloaded papers with filtering options",
         "args": {
@@ -101,7 +113,8 @@ TOOL_DESCRIPTIONS = {
         "description": "Extract citations from paper text or PDF",
         "args": {
             "paper_text": "Full text of the paper",
-            "paper_url": "Alternative: URL to paper PDF"
+            "paper_url": "Alternative: URL to paper PDF",
+            "known_authors": "Optional: Author names to detect in the text"
         },
         "returns": "List of extracted citations with parsed metadata"
     },
@@ -148,6 +161,30 @@ TOOL_DESCRIPTIONS = {
 }
 
 
+# Tools satisfied by any one of several argument sets
+_EITHER_OR: Dict[str, List[FrozenSet[str]]] = {
+    "extract_citations": [frozenset({"paper_text"}), frozenset({"paper_url"})],
+}
+
+
+def _required_args(tool_name: str, args: Dict[str, str]) -> FrozenSet[str]:
+    """Arguments described as neither optional, defaulted nor either-or alternatives."""
+    alternatives = frozenset().union(*_EITHER_OR.get(tool_name, ()))
+    return frozenset(
+        name for name, desc in args.items()
+        if "optional" not in desc.lower()
+        and "default:" not in desc
+        and name not in alternatives
+    )
+
+
+# Required arguments per tool, derived once from the descriptions
+_REQUIRED_ARGS: Dict[str, FrozenSet[str]] = {
+    name: _required_args(name, desc.get("args", {}))
+    for name, desc in TOOL_DESCRIPTIONS.items()
+}
+
+
 @activity.defn
 async def get_available_tools() -> List[str]:
     """Get list of available research tools."""
@@ -186,20 +223,37 @@ async def validate_tool_usage(tool_name: str, tool_args: Dict[str, Any]) -> Dict
             "reason": f"Tool '{tool_name}' missing description metadata"
         }
     
-    # Basic argument validation
+    # Basic argument validation; None and empty strings count as missing
     tool_desc = TOOL_DESCRIPTIONS[tool_name]
-    required_args = tool_desc.get("args", {})
+    required = _REQUIRED_ARGS.get(tool_name)
+    if required is None:
+        required = _required_args(tool_name, tool_desc.get("args", {}))
+        _REQUIRED_ARGS[tool_name] = required
+    provided = {
+        name for name, value in tool_args.items() if value is not None and value != ""
+    }
     
-    missing_args = []
-    for arg_name, arg_desc in required_args.items():
-        if "Optional:" not in arg_desc and arg_name not in tool_args:
-            missing_args.append(arg_name)
+    options = _EITHER_OR.get(tool_name)
+    if options and not any(option <= provided for option in options):
+        alternatives = " or ".join(
+            f"'{name}'" for option in options for name in sorted(option)
+        )
+        return {
+            "valid": False,
+            "reason": f"{tool_name} requires either {alternatives}",
+            "required_args": tool_desc.get("args", {})
+        }
     
-    if missing_args:
+    missing = required - provided
+    if missing:
+        missing_names = ", ".join(f"'{name}'" for name in sorted(missing))
         return {
             "valid": False,
-            "reason": f"Missing required arguments: {missing_args}",
-            "required_args": required_args
+            "reason": (
+                f"{tool_name} requires {missing_names} "
+                f"parameter{'s' if len(missing) > 1 else ''}"
+            ),
+            "required_args": tool_desc.get("args", {})
         }
     
     return {
@@ -235,6 +289,7 @@ def register_tool(name: str, handler: Callable, description: Dict[str, Any]) ->
     
     TOOL_REGISTRY[name] = handler
     TOOL_DESCRIPTIONS[name] = description
+    _REQUIRED_ARGS[name] = _required_args(name, description.get("args", {}))
 
 
 def unregister_tool(name: str) -> bool:
@@ -252,6 +307,7 @@ def unregister_tool(name: str) -> bool:
         del TOOL_REGISTRY[name]
         if name in TOOL_DESCRIPTIONS:
             del TOOL_DESCRIPTIONS[name]
+        _REQUIRED_ARGS.pop(name, None)
         return True
     
     return False
\ No newline at end of file
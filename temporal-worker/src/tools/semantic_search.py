@@ -3,11 +3,73 @@ Semantic search tools for finding related papers and calculating similarity.
 Uses NLP techniques for intelligent paper relationship discovery.
 """
 
+import asyncio
+import logging
+import os
 import re
-from typing import Any, Dict, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.metrics.pairwise import linear_kernel
+
+try:
+    # Optional: simsimd computes a dense cosine in one SIMD reduction
+    import simsimd
+except ImportError:
+    simsimd = None
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, keeping the default if invalid."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.warning(f"Ignoring invalid {name}={value!r}; using {default}")
+        return default
+
+
+# Academic paper artifacts ("figure 5", "sec 4.1") are tried before the
+# non-letter class so their numbers are still there to match
+_PREPROCESS_RE = re.compile(
+    r'\b(?:fig|figure|table|equation|eq|section|sec)\s*\d+(?:\.\d+)*\b'
+    r'|[^a-z\s]+'
+)
+
+# Texts up to this length keep their preprocessed form in an LRU cache
+_PREPROCESS_CACHE_MAX_CHARS = 64 * 1024
+
+# Corpora at least this large are searched through a cached per-corpus index;
+# smaller ones are cheap enough to vectorize together with the reference
+_INDEX_MIN_CORPUS = 32
+
+# Ad-hoc corpus matrices with fewer stored values than this are scored dense
+_DENSE_MAX_NNZ = _env_int("SEMANTIC_SEARCH_DENSE_MAX_NNZ", 50000)
+
+# Cached corpora are scored across threads in row blocks of at least this many
+# rows (scipy's sparse products release the GIL), so splitting starts once a
+# corpus fills two blocks
+_PARALLEL_BLOCK_ROWS = 4096
+
+
+@dataclass
+class _CorpusIndex:
+    """Term counts of one search corpus, analyzed once and reused across queries."""
+    analyzer: Callable[[str], List[str]]
+    terms: np.ndarray  # Corpus vocabulary, sorted like TfidfVectorizer's
+    counts: sparse.csr_matrix  # Document-term counts
+    squared: sparse.csr_matrix  # Counts squared, for per-query row norms
+    doc_freq: np.ndarray
+    term_freq: np.ndarray
+    # (counts, squared) row blocks scored in parallel
+    blocks: Tuple[Tuple[sparse.csr_matrix, sparse.csr_matrix], ...] = ()
 
 
 async def find_similar_papers(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -25,6 +87,13 @@ async def find_similar_papers(args: Dict[str, Any]) -> Dict[str, Any]:
         List of similar papers with similarity scores
     """
     
+    # Vectorization and scoring are CPU-bound; keep them off the event loop
+    return await asyncio.to_thread(_find_similar_papers, args)
+
+
+def _find_similar_papers(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Blocking body of find_similar_papers."""
+    
     reference_paper = args.get("reference_paper", "")
     search_corpus = args.get("search_corpus", [])
     max_results = args.get("max_results", 10)
@@ -37,6 +106,9 @@ async def find_similar_papers(args: Dict[str, Any]) -> Dict[str, Any]:
             "similar_papers": []
         }
     
+    # The built-in sample corpus never changes, so it always goes through the
+    # cached index rather than being re-fitted on every call
+    use_index = not search_corpus or len(search_corpus) >= _INDEX_MIN_CORPUS
     if not search_corpus:
         # Use sample corpus if none provided
         search_corpus = _get_sample_corpus()
@@ -44,42 +116,54 @@ async def find_similar_papers(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         # Preprocess texts
         reference_text = _preprocess_text(reference_paper)
-        corpus_texts = [_preprocess_text(paper.get("text", "")) for paper in search_corpus]
-        
-        # Create combined corpus for vectorization
-        all_texts = [reference_text] + corpus_texts
-        
-        # Vectorize using TF-IDF
-        vectorizer = TfidfVectorizer(
-            max_features=5000,
-            stop_words='english',
-            ngram_range=(1, 2),
-            min_df=1,
-            max_df=0.95
-        )
         
-        tfidf_matrix = vectorizer.fit_transform(all_texts)
+        # Only the best max_results papers are ever turned into result dicts
+        top_k = len(search_corpus)
+        if max_results is not None:
+            top_k = max(0, min(max_results, top_k))
         
-        # Calculate similarities
-        reference_vector = tfidf_matrix[0:1]
-        corpus_vectors = tfidf_matrix[1:]
-        
-        similarities = cosine_similarity(reference_vector, corpus_vectors).flatten()
+        if use_index:
+            # Large or sample corpus: query the cached index
+            corpus_index = _build_corpus_index(
+                tuple(paper.get("text", "") for paper in search_corpus)
+            )
+            scored = _search_corpus_index(corpus_index, reference_text, top_k)
+        else:
+            corpus_texts = [
+                _preprocess_text(paper.get("text", "")) for paper in search_corpus
+            ]
+            
+            # Create combined corpus for vectorization
+            all_texts = [reference_text] + corpus_texts
+            
+            # Vectorize using TF-IDF
+            vectorizer = _corpus_vectorizer()
+            tfidf_matrix = vectorizer.fit_transform(all_texts)
+            
+            # Calculate similarities
+            reference_vector = tfidf_matrix[0:1]
+            corpus_vectors = tfidf_matrix[1:]
+            
+            # TfidfVectorizer rows are already L2-normalized, so cosine
+            # similarity is a plain dot product with the reference; tiny
+            # matrices are cheaper dense than through sparse bookkeeping
+            reference_dense = reference_vector.toarray().ravel()
+            if corpus_vectors.nnz < _DENSE_MAX_NNZ:
+                similarities = corpus_vectors.toarray() @ reference_dense
+            else:
+                similarities = corpus_vectors @ reference_dense
+            scored = _top_matches(similarities, top_k)
         
-        # Create results with similarity scores
+        # Create results with similarity scores; matches arrive best first, so
+        # the first one under the threshold ends the list
         similar_papers = []
-        for idx, similarity_score in enumerate(similarities):
-            if similarity_score >= similarity_threshold:
-                paper = search_corpus[idx].copy()
-                paper["similarity_score"] = float(similarity_score)
-                paper["similarity_rank"] = len(similar_papers) + 1
-                similar_papers.append(paper)
-        
-        # Sort by similarity score
-        similar_papers.sort(key=lambda x: x["similarity_score"], reverse=True)
-        
-        # Limit results
-        similar_papers = similar_papers[:max_results]
+        for idx, similarity_score in scored:
+            if similarity_score < similarity_threshold:
+                break
+            paper = search_corpus[idx].copy()
+            paper["similarity_score"] = similarity_score
+            paper["similarity_rank"] = len(similar_papers) + 1
+            similar_papers.append(paper)
         
         return {
             "success": True,
@@ -101,6 +185,174 @@ async def find_similar_papers(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+def _corpus_vectorizer() -> TfidfVectorizer:
+    """TF-IDF settings shared by every corpus search."""
+    return TfidfVectorizer(
+        max_features=5000,
+        stop_words='english',
+        ngram_range=(1, 2),
+        min_df=1,
+        max_df=0.95
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_corpus_index(corpus_texts: Tuple[str, ...]) -> _CorpusIndex:
+    """
+    Count the terms of a search corpus once for repeated searches.
+    
+    Cached on the raw corpus texts, so repeated searches over the same corpus
+    skip preprocessing and tokenization. The TF-IDF weights themselves depend
+    on the reference paper and are derived per query in _search_corpus_index.
+    """
+    
+    analyzer = _corpus_vectorizer().build_analyzer()
+    counter = CountVectorizer(analyzer=analyzer)
+    try:
+        counts = counter.fit_transform(
+            [_preprocess_text(text) for text in corpus_texts]
+        )
+        terms = counter.get_feature_names_out()
+    except ValueError:
+        # Nothing but stop words; only the reference can contribute terms
+        counts = sparse.csr_matrix((len(corpus_texts), 0), dtype=np.int64)
+        terms = np.array([], dtype=object)
+    
+    counts = counts.tocsr()
+    # Term frequencies stay float64 like TfidfVectorizer's, so max_features
+    # breaks ties in the same order as the joint fit
+    counts = counts.astype(np.float64)
+    doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+    term_freq = np.asarray(counts.sum(axis=0)).ravel()
+    squared = counts.multiply(counts).tocsr()
+    
+    blocks = ()
+    workers = min(os.cpu_count() or 1, counts.shape[0] // _PARALLEL_BLOCK_ROWS)
+    if workers > 1:
+        bounds = np.linspace(0, counts.shape[0], workers + 1, dtype=int)
+        blocks = tuple(
+            (counts[start:end], squared[start:end])
+            for start, end in zip(bounds[:-1], bounds[1:])
+        )
+    
+    return _CorpusIndex(
+        analyzer=analyzer,
+        terms=terms,
+        counts=counts,
+        squared=squared,
+        doc_freq=doc_freq,
+        term_freq=term_freq,
+        blocks=blocks
+    )
+
+
+def _search_corpus_index(
+    corpus_index: _CorpusIndex,
+    reference_text: str,
+    top_k: int
+) -> Iterable[Tuple[int, float]]:
+    """
+    Return (corpus position, similarity) for the top_k matches, best first.
+    
+    Scores are those of a TfidfVectorizer fitted on the reference plus the
+    corpus: the reference's terms, including ones the corpus never uses, join
+    the document frequencies and the max_df/max_features pruning before IDF
+    weights are taken, so results do not depend on which path ran.
+    """
+    
+    settings = _corpus_vectorizer()
+    query_counts = Counter(corpus_index.analyzer(reference_text))
+    query_terms = np.array(sorted(query_counts), dtype=object)
+    query_tf = np.array([query_counts[term] for term in query_terms], dtype=float)
+    
+    # Split the reference's terms into corpus columns and new terms
+    terms = corpus_index.terms
+    positions = np.searchsorted(terms, query_terms)
+    known = positions < len(terms)
+    known[known] = terms[positions[known]] == query_terms[known]
+    columns = positions[known]
+    
+    n_docs = corpus_index.counts.shape[0] + 1
+    doc_freq = corpus_index.doc_freq.copy()
+    doc_freq[columns] += 1
+    term_freq = corpus_index.term_freq.copy()
+    term_freq[columns] += query_tf[known]
+    
+    # Lay out the joint vocabulary in sorted order, as the joint fit would
+    new_slots = positions[~known] + np.arange(np.count_nonzero(~known))
+    doc_freq = np.insert(doc_freq, positions[~known], 1)
+    term_freq = np.insert(term_freq, positions[~known], query_tf[~known])
+    if len(doc_freq) == 0:
+        raise ValueError(
+            "empty vocabulary; perhaps the documents only contain stop words"
+        )
+    
+    kept = doc_freq <= settings.max_df * n_docs
+    if kept.sum() > settings.max_features:
+        order = (-term_freq[kept]).argsort()[:settings.max_features]
+        limited = np.zeros(len(kept), dtype=bool)
+        limited[np.where(kept)[0][order]] = True
+        kept = limited
+    if not kept.any():
+        raise ValueError(
+            "After pruning, no terms remain. Try a lower min_df or a higher max_df."
+        )
+    
+    idf = np.where(kept, np.log((1 + n_docs) / (1 + doc_freq)) + 1, 0.0)
+    new_weights = query_tf[~known] * idf[new_slots]
+    idf = np.delete(idf, new_slots)
+    known_weights = query_tf[known] * idf[columns]
+    query_norm = np.sqrt(known_weights @ known_weights + new_weights @ new_weights)
+    
+    top_k = min(top_k, corpus_index.counts.shape[0])
+    if query_norm == 0:
+        return _top_matches(np.zeros(corpus_index.counts.shape[0]), top_k)
+    
+    # Both products are plain SpMVs over the cached counts: one for the dot
+    # with the reference, one for each row's norm under this query's IDF
+    query_vector = np.zeros(len(terms))
+    query_vector[columns] = known_weights * idf[columns]
+    norm_weights = idf * idf
+    
+    def score(counts: sparse.csr_matrix, squared: sparse.csr_matrix) -> np.ndarray:
+        row_norms = np.sqrt(squared @ norm_weights)
+        dots = counts @ query_vector
+        return np.divide(
+            dots, row_norms * query_norm, out=np.zeros_like(dots), where=row_norms > 0
+        )
+    
+    if corpus_index.blocks:
+        parts = _block_executor().map(lambda block: score(*block), corpus_index.blocks)
+        similarities = np.concatenate(list(parts))
+    else:
+        similarities = score(corpus_index.counts, corpus_index.squared)
+    
+    return _top_matches(similarities, top_k)
+
+
+@lru_cache(maxsize=None)
+def _block_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every block-parallel search, created on first use."""
+    return ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1, thread_name_prefix="semantic-search"
+    )
+
+
+def _top_matches(similarities: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+    """
+    Select the top_k (position, score) pairs without sorting every score.
+    
+    argpartition finds the top_k in linear time and only those are sorted,
+    by score descending and then corpus position.
+    """
+    
+    if top_k <= 0:
+        return []
+    top = np.argpartition(-similarities, top_k - 1)[:top_k]
+    top = top[np.lexsort((top, -similarities[top]))]
+    return [(int(i), float(similarities[i])) for i in top]
+
+
 async def calculate_paper_similarity(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate semantic similarity between two papers.
@@ -115,6 +367,13 @@ async def calculate_paper_similarity(args: Dict[str, Any]) -> Dict[str, Any]:
         Similarity score and detailed comparison metrics
     """
     
+    # Vectorization and scoring are CPU-bound; keep them off the event loop
+    return await asyncio.to_thread(_calculate_paper_similarity, args)
+
+
+def _calculate_paper_similarity(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Blocking body of calculate_paper_similarity."""
+    
     paper1_text = args.get("paper1_text", "")
     paper2_text = args.get("paper2_text", "")
     method = args.get("method", "tfidf_cosine")
@@ -129,18 +388,11 @@ async def calculate_paper_similarity(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         # Preprocess texts
         text1 = _preprocess_text(paper1_text)
-        text2 = _preprocess_text(paper2_text)
+        text2 = text1 if paper2_text == paper1_text else _preprocess_text(paper2_text)
         
-        # Calculate similarity based on method
-        if method == "tfidf_cosine":
-            similarity_data = _calculate_tfidf_similarity(text1, text2)
-        elif method == "jaccard":
-            similarity_data = _calculate_jaccard_similarity(text1, text2)
-        elif method == "word_overlap":
-            similarity_data = _calculate_word_overlap(text1, text2)
-        else:
-            # Default to TF-IDF cosine
-            similarity_data = _calculate_tfidf_similarity(text1, text2)
+        # Calculate similarity based on method, defaulting to TF-IDF cosine
+        calculate = _SIMILARITY_METHODS.get(method, _calculate_tfidf_similarity)
+        similarity_data = calculate(text1, text2)
         
         # Add metadata
         similarity_data["comparison_metadata"] = {
@@ -167,20 +419,24 @@ async def calculate_paper_similarity(args: Dict[str, Any]) -> Dict[str, Any]:
 def _preprocess_text(text: str) -> str:
     """Preprocess text for similarity analysis."""
     
-    # Convert to lowercase
-    text = text.lower()
+    # Abstracts and corpus entries recur across calls; full papers are not
+    # worth pinning in the cache
+    if len(text) <= _PREPROCESS_CACHE_MAX_CHARS:
+        return _preprocess_text_cached(text)
+    return _clean_text(text)
+
+
+def _clean_text(text: str) -> str:
+    """Lowercase text and strip paper artifacts, non-letters and extra whitespace."""
     
-    # Remove special characters and numbers
-    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+    # One scan drops figure/table/section references and every non-letter run
+    text = _PREPROCESS_RE.sub(' ', text.lower())
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove common academic paper artifacts
-    text = re.sub(r'\b(?:fig|figure|table|equation|eq)\s*\d+\b', '', text)
-    text = re.sub(r'\b(?:section|sec)\s*\d+\b', '', text)
-    
-    return text.strip()
+    return ' '.join(text.split())
+
+
+_preprocess_text_cached = lru_cache(maxsize=256)(_clean_text)
 
 
 def _calculate_tfidf_similarity(text1: str, text2: str) -> Dict[str, Any]:
@@ -193,34 +449,36 @@ def _calculate_tfidf_similarity(text1: str, text2: str) -> Dict[str, Any]:
         max_features=1000
     )
     
-    tfidf_matrix = vectorizer.fit_transform([text1, text2])
+    # Identical texts share every term, so IDF is flat and a single fitted row
+    # stands for both documents
+    identical = text1 == text2
+    tfidf_matrix = vectorizer.fit_transform([text1] if identical else [text1, text2])
     
-    # Calculate cosine similarity
-    similarity_matrix = cosine_similarity(tfidf_matrix)
-    similarity_score = similarity_matrix[0, 1]
+    if identical:
+        similarity_score = 1.0 if tfidf_matrix.nnz else 0.0
+    else:
+        similarity_score = _pair_cosine(tfidf_matrix)
     
     # Get feature names for analysis
     feature_names = vectorizer.get_feature_names_out()
     
-    # Find top common terms
-    tfidf1 = tfidf_matrix[0].toarray().flatten()
-    tfidf2 = tfidf_matrix[1].toarray().flatten()
-    
-    # Get top terms for each document
-    top_terms1 = [(feature_names[i], tfidf1[i]) for i in tfidf1.argsort()[-10:][::-1] if tfidf1[i] > 0]
-    top_terms2 = [(feature_names[i], tfidf2[i]) for i in tfidf2.argsort()[-10:][::-1] if tfidf2[i] > 0]
+    # Get top terms for each document straight from the sparse rows
+    top_terms1 = _top_terms(tfidf_matrix.getrow(0), feature_names)
+    top_terms2 = (
+        top_terms1 if identical else _top_terms(tfidf_matrix.getrow(1), feature_names)
+    )
     
     # Find common important terms
-    common_terms = []
-    for term1, score1 in top_terms1:
-        for term2, score2 in top_terms2:
-            if term1 == term2:
-                common_terms.append({
-                    "term": term1,
-                    "score1": score1,
-                    "score2": score2,
-                    "avg_score": (score1 + score2) / 2
-                })
+    scores2 = dict(top_terms2)
+    common_terms = [
+        {
+            "term": term,
+            "score1": score1,
+            "score2": scores2[term],
+            "avg_score": (score1 + scores2[term]) / 2
+        }
+        for term, score1 in top_terms1 if term in scores2
+    ]
     
     return {
         "method": "tfidf_cosine",
@@ -231,22 +489,50 @@ def _calculate_tfidf_similarity(text1: str, text2: str) -> Dict[str, Any]:
     }
 
 
+def _pair_cosine(tfidf_matrix: sparse.csr_matrix) -> float:
+    """Cosine similarity of the two rows of a TF-IDF matrix."""
+    
+    row1, row2 = tfidf_matrix.getrow(0), tfidf_matrix.getrow(1)
+    if simsimd is not None and row1.nnz and row2.nnz:
+        # simsimd returns cosine distance; an empty row would read as identical,
+        # hence the nnz guard
+        pair = tfidf_matrix.toarray().astype(np.float32)
+        return 1.0 - float(simsimd.cosine(pair[0], pair[1]))
+    # Rows are L2-normalized, so their dot product is the cosine similarity
+    return float(linear_kernel(row1, row2)[0, 0])
+
+
+def _top_terms(
+    row: sparse.csr_matrix, feature_names: np.ndarray, count: int = 10
+) -> List[Tuple[str, float]]:
+    """Highest-weighted (term, score) pairs of a TF-IDF row; ties alphabetical."""
+    
+    # Only the row's nonzeros are ranked; feature indices follow term order
+    top = np.lexsort((row.indices, -row.data))[:count]
+    return [(feature_names[row.indices[i]], row.data[i]) for i in top]
+
+
 def _calculate_jaccard_similarity(text1: str, text2: str) -> Dict[str, Any]:
     """Calculate Jaccard similarity between word sets."""
     
     words1 = set(text1.split())
     words2 = set(text2.split())
     
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    # Probe with the smaller set; hash lookups scale with the iterated side
+    smaller, larger = (
+        (words1, words2) if len(words1) <= len(words2) else (words2, words1)
+    )
+    intersection = smaller.intersection(larger)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, without building the union set
+    union_size = len(words1) + len(words2) - len(intersection)
     
-    jaccard_score = len(intersection) / len(union) if union else 0
+    jaccard_score = len(intersection) / union_size if union_size else 0
     
     return {
         "method": "jaccard",
         "similarity_score": jaccard_score,
         "common_words": len(intersection),
-        "total_unique_words": len(union),
+        "total_unique_words": union_size,
         "words_paper1": len(words1),
         "words_paper2": len(words2),
         "sample_common_words": list(intersection)[:10]
@@ -259,19 +545,13 @@ def _calculate_word_overlap(text1: str, text2: str) -> Dict[str, Any]:
     words1 = text1.split()
     words2 = text2.split()
     
-    # Count word frequencies
-    freq1 = {}
-    freq2 = {}
-    
-    for word in words1:
-        freq1[word] = freq1.get(word, 0) + 1
-    
-    for word in words2:
-        freq2[word] = freq2.get(word, 0) + 1
-    
-    # Calculate overlap
-    common_words = set(freq1.keys()).intersection(set(freq2.keys()))
-    overlap_count = sum(min(freq1[word], freq2[word]) for word in common_words)
+    # Counter counts tokens in C; & keeps min(freq1, freq2) per shared word and
+    # walks the left operand, so put the shorter text there
+    shorter, longer = (
+        (words1, words2) if len(words1) <= len(words2) else (words2, words1)
+    )
+    common_words = Counter(shorter) & Counter(longer)
+    overlap_count = sum(common_words.values())
     
     total_words = len(words1) + len(words2)
     overlap_ratio = (2 * overlap_count) / total_words if total_words > 0 else 0
@@ -286,6 +566,14 @@ def _calculate_word_overlap(text1: str, text2: str) -> Dict[str, Any]:
     }
 
 
+# Similarity method name -> implementation for calculate_paper_similarity
+_SIMILARITY_METHODS: Dict[str, Callable[[str, str], Dict[str, Any]]] = {
+    "tfidf_cosine": _calculate_tfidf_similarity,
+    "jaccard": _calculate_jaccard_similarity,
+    "word_overlap": _calculate_word_overlap,
+}
+
+
 def _get_sample_corpus() -> List[Dict[str, Any]]:
     """Get sample corpus for testing when no corpus provided."""
     
@@ -15,6 +15,17 @@ from src.activities.dynamic_tool_activity import dynamic_tool_activity
 from src.activities.llm_activities import llm_analyze, llm_plan_research
 from src.activities.tool_registry_activities import get_available_tools, validate_tool_usage
 
+# Activity options are immutable, so build them once instead of on every
+# iteration (workflow code is re-executed on replay).
+_PLAN_TIMEOUT = timedelta(minutes=5)
+_PLAN_RETRY = RetryPolicy(maximum_attempts=3)
+_REGISTRY_TIMEOUT = timedelta(seconds=30)
+_ANALYZE_TIMEOUT = timedelta(minutes=3)
+_ANALYZE_RETRY = RetryPolicy(maximum_attempts=2)
+_TOOL_TIMEOUT = timedelta(minutes=10)
+_TOOL_RETRY = RetryPolicy(maximum_attempts=2)
+_SUMMARY_TIMEOUT = timedelta(minutes=5)
+
 
 @workflow.defn
 class ResearchWorkflow:
@@ -46,8 +57,8 @@ class ResearchWorkflow:
             research_plan = await workflow.execute_activity(
                 llm_plan_research,
                 args=[research_query],
-                start_to_close_timeout=timedelta(minutes=5),
-                retry_policy=RetryPolicy(maximum_attempts=3)
+                start_to_close_timeout=_PLAN_TIMEOUT,
+                retry_policy=_PLAN_RETRY
             )
             
             self.research_context["plan"] = research_plan
@@ -61,15 +72,15 @@ class ResearchWorkflow:
                 # Get available tools
                 available_tools = await workflow.execute_activity(
                     get_available_tools,
-                    start_to_close_timeout=timedelta(seconds=30)
+                    start_to_close_timeout=_REGISTRY_TIMEOUT
                 )
                 
                 # Analyze current state and decide next action
                 next_action = await workflow.execute_activity(
                     llm_analyze,
                     args=[self.research_context, available_tools],
-                    start_to_close_timeout=timedelta(minutes=3),
-                    retry_policy=RetryPolicy(maximum_attempts=2)
+                    start_to_close_timeout=_ANALYZE_TIMEOUT,
+                    retry_policy=_ANALYZE_RETRY
                 )
                 
                 if next_action.get("action") == "complete":
@@ -81,7 +92,7 @@ class ResearchWorkflow:
                     tool_validation = await workflow.execute_activity(
                         validate_tool_usage,
                         args=[next_action["tool_name"], next_action["tool_args"]],
-                        start_to_close_timeout=timedelta(seconds=30)
+                        start_to_close_timeout=_REGISTRY_TIMEOUT
                     )
                     
                     if tool_validation["valid"]:
@@ -89,8 +100,8 @@ class ResearchWorkflow:
                         tool_result = await workflow.execute_activity(
                             dynamic_tool_activity,
                             args=[next_action["tool_name"], next_action["tool_args"]],
-                            start_to_close_timeout=timedelta(minutes=10),
-                            retry_policy=RetryPolicy(maximum_attempts=2)
+                            start_to_close_timeout=_TOOL_TIMEOUT,
+                            retry_policy=_TOOL_RETRY
                         )
                         
                         # Update research context with results
@@ -106,7 +117,7 @@ class ResearchWorkflow:
             final_summary = await workflow.execute_activity(
                 llm_analyze,
                 args=[self.research_context, [], "summarize"],
-                start_to_close_timeout=timedelta(minutes=5)
+                start_to_close_timeout=_SUMMARY_TIMEOUT
             )
             
             self.research_context["status"] = "completed"
@@ -151,6 +162,15 @@ class ResearchWorkflow:
             if "paper_id" in tool_result:
                 self.research_context["downloaded_papers"].append(tool_result["paper_id"])
         
+        # Handle bulk paper download results
+        elif tool_name == "arxiv_download_papers" and tool_result.get("success"):
+            if "downloaded_papers" not in self.research_context:
+                self.research_context["downloaded_papers"] = []
+            self.research_context["downloaded_papers"].extend(
+                result["paper_id"] for result in tool_result.get("results", [])
+                if result.get("success") and "paper_id" in result
+            )
+        
         # Handle paper reading results
         elif tool_name == "arxiv_read_paper" and tool_result.get("success"):
             if "read_papers" not in self.research_context:
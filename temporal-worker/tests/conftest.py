@@ -6,15 +6,84 @@ Provides shared fixtures, test data, and configuration for all test modules.
 import pytest
 import os
 import asyncio
+import hashlib
+from pathlib import Path
 from typing import Dict, Any, List
 
+import requests
+
+try:
+    # Optional: libuv-based loop with a C scheduler, faster for async-heavy suites
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Create the session event loop with uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+ATTENTION_PDF_URL = "https://arxiv.org/pdf/1706.03762.pdf"
+
+# Downloaded fixtures persist here between runs (git-ignored)
+FIXTURE_CACHE_DIR = Path(__file__).parent / ".cache" / "arxiv"
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def arxiv_attention_pdf():
+    """Bytes of the "Attention Is All You Need" PDF, downloaded once and cached on disk."""
+    cache_file = FIXTURE_CACHE_DIR / f"{hashlib.sha256(ATTENTION_PDF_URL.encode()).hexdigest()}.pdf"
+    if cache_file.exists():
+        return cache_file.read_bytes()
+    
+    try:
+        response = requests.get(ATTENTION_PDF_URL, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        pytest.skip(f"arXiv PDF not cached and download failed: {e}")
+    
+    # Write then rename so an interrupted run never leaves a truncated cache entry
+    FIXTURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(response.content)
+    os.replace(tmp_file, cache_file)
+    return response.content
+
+
+class _FakePage:
+    """Minimal pdfplumber page: only extract_text()."""
+    __slots__ = ("_text",)
+    
+    def __init__(self, text: str):
+        self._text = text
+    
+    def extract_text(self) -> str:
+        return self._text
+
+
+class _FakePDF:
+    """Minimal pdfplumber PDF usable as a context manager."""
+    __slots__ = ("pages", "metadata")
+    
+    def __init__(self, pages: List[_FakePage], metadata: Dict[str, Any]):
+        self.pages = pages
+        self.metadata = metadata
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture
+def fake_pdf_factory():
+    """Build lightweight stand-ins for pdfplumber.open() results."""
+    def _make(text: str, pages: int = 1, metadata: Dict[str, Any] = None) -> _FakePDF:
+        return _FakePDF([_FakePage(text)] * pages, metadata or {})
+    return _make
 
 
 @pytest.fixture
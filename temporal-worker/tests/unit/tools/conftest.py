@@ -0,0 +1,21 @@
+"""
+Fixtures shared by the tool unit tests.
+"""
+
+import pytest
+
+from src.tools import registry
+from src.tools.registry import TOOL_REGISTRY, TOOL_DESCRIPTIONS
+
+
+@pytest.fixture(autouse=True)
+def _registry_snapshot():
+    """Restore the tool registry after each test, even if it fails mid-mutation."""
+    snapshots = [
+        (table, table.copy())
+        for table in (TOOL_REGISTRY, TOOL_DESCRIPTIONS, registry._REQUIRED_ARGS)
+    ]
+    yield
+    for table, saved in snapshots:
+        table.clear()
+        table.update(saved)
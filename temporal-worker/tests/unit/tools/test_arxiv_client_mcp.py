@@ -3,34 +3,99 @@ Tests for enhanced arXiv client using arxiv-mcp-server.
 Tests enhanced search, local storage, paper management, and caching functionality.
 """
 
+import asyncio
+import os
 import pytest
 import tempfile
 import shutil
+import sys
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import patch, Mock
+from typing import Optional, Tuple
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.tools import arxiv_client_mcp
 from src.tools.arxiv_client_mcp import (
     ArxivMCPServerClient as ArxivMCPClient,
     arxiv_search_papers,
     arxiv_download_paper,
+    arxiv_download_papers,
     arxiv_list_papers,
     arxiv_read_paper,
     arxiv_get_paper_metadata
 )
 
 
+@dataclass(frozen=True, slots=True)
+class _FakeAuthor:
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeArxivResult:
+    """Stand-in for arxiv.Result carrying only the fields the client reads."""
+    entry_id: str
+    title: str
+    authors: Tuple[_FakeAuthor, ...]
+    summary: str
+    categories: Tuple[str, ...]
+    primary_category: str
+    pdf_url: str
+    published: Optional[object] = None
+    updated: Optional[object] = None
+    doi: Optional[str] = None
+    journal_ref: Optional[str] = None
+    comment: Optional[str] = None
+
+
+# Built once and shared; frozen so no test can leak changes into another
+FAKE_ATTENTION_RESULT = _FakeArxivResult(
+    entry_id="https://arxiv.org/abs/1706.03762",
+    title="Test Paper",
+    authors=(_FakeAuthor("Test Author"),),
+    summary="Test abstract",
+    categories=("cs.AI",),
+    primary_category="cs.AI",
+    pdf_url="https://arxiv.org/pdf/1706.03762.pdf",
+)
+
+
+@pytest.fixture(scope="session")
+def _tmpfs_root():
+    """Session-wide storage root, on RAM-backed /dev/shm when available."""
+    shm = Path("/dev/shm")
+    root = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    base = root / f"arxiv_mcp_{os.getpid()}"
+    base.mkdir(exist_ok=True)
+    yield base
+    shutil.rmtree(base, ignore_errors=True)
+
+
 @pytest.fixture
-def temp_storage():
-    """Create temporary storage directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+def temp_storage(_tmpfs_root, request):
+    """Create a per-test storage directory under the session root."""
+    temp_dir = _tmpfs_root / request.node.name
+    temp_dir.mkdir()
+    yield str(temp_dir)
+
+
+@pytest.fixture(scope="module")
+def _shared_client(_tmpfs_root):
+    """MCP client reused across the module to skip storage scaffolding."""
+    return ArxivMCPClient(storage_path=str(_tmpfs_root / "shared"))
 
 
 @pytest.fixture
-def mcp_client(temp_storage):
-    """Create MCP client with temporary storage."""
-    return ArxivMCPClient(storage_path=temp_storage)
+def mcp_client(_shared_client, monkeypatch):
+    """Install the shared MCP client, with empty storage and index, as the module client."""
+    for f in _shared_client.storage_path.glob("*"):
+        if f.is_file():
+            f.unlink(missing_ok=True)
+    _shared_client.papers_index = {}
+    _shared_client._save_papers_index()
+    monkeypatch.setattr(arxiv_client_mcp, "mcp_client", _shared_client)
+    return _shared_client
 
 
 @pytest.mark.unit
@@ -65,6 +130,83 @@ def test_arxiv_mcp_client_papers_index(mcp_client):
     assert new_client.papers_index == test_data
 
 
+@pytest.mark.unit
+def test_arxiv_mcp_client_index_cache_and_reload(mcp_client):
+    """Test that clients never share cached index entries and external edits reload."""
+    mcp_client.papers_index = {"paper1": {"title": "Saved Paper"}}
+    mcp_client._save_papers_index()
+    
+    # Nested entries are copies, so one client's edits never leak into another
+    first = ArxivMCPClient(storage_path=str(mcp_client.storage_path))
+    first.papers_index["paper1"]["title"] = "Edited In Memory"
+    second = ArxivMCPClient(storage_path=str(mcp_client.storage_path))
+    assert second.papers_index == {"paper1": {"title": "Saved Paper"}}
+    
+    # An out-of-band rewrite changes size/mtime, so the cached parse is not reused
+    with open(mcp_client.papers_index_file, 'w') as f:
+        json.dump({"paper2": {"title": "Externally Added"}}, f)
+    
+    new_client = ArxivMCPClient(storage_path=str(mcp_client.storage_path))
+    assert new_client.papers_index == {"paper2": {"title": "Externally Added"}}
+
+
+@pytest.mark.unit
+def test_arxiv_mcp_client_index_concurrent_saves(temp_storage):
+    """Test that clients saving one index keep each other's entries and removals."""
+    first = ArxivMCPClient(storage_path=temp_storage)
+    second = ArxivMCPClient(storage_path=temp_storage)
+    
+    first.papers_index["paper1"] = {"title": "First"}
+    first._save_papers_index()
+    second.papers_index["paper2"] = {"title": "Second"}
+    second._save_papers_index()
+    
+    both = {"paper1": {"title": "First"}, "paper2": {"title": "Second"}}
+    assert second.papers_index == both
+    
+    # A removal by a client that had seen the entry sticks
+    del second.papers_index["paper1"]
+    second._save_papers_index()
+    
+    reloaded = ArxivMCPClient(storage_path=temp_storage)
+    assert reloaded.papers_index == {"paper2": {"title": "Second"}}
+
+
+@pytest.mark.unit
+def test_arxiv_mcp_client_index_save_rereads_only_external_changes(
+    temp_storage, monkeypatch
+):
+    """Test saves only re-parse the index after a write the cache never saw."""
+    first = ArxivMCPClient(storage_path=temp_storage)
+    second = ArxivMCPClient(storage_path=temp_storage)
+    
+    reads = []
+    read_json = arxiv_client_mcp._read_json
+    
+    def counting_read_json(path):
+        reads.append(path)
+        return read_json(path)
+    monkeypatch.setattr(arxiv_client_mcp, "_read_json", counting_read_json)
+    
+    # Unchanged since this client synced, then changed by a client sharing the cache
+    first.papers_index["paper1"] = {"title": "First"}
+    first._save_papers_index()
+    second.papers_index["paper2"] = {"title": "Second"}
+    second._save_papers_index()
+    assert reads == []
+    assert second.papers_index == {
+        "paper1": {"title": "First"}, "paper2": {"title": "Second"}
+    }
+    
+    # Another process rewrote the file, so it is parsed and merged
+    with open(first.papers_index_file, 'w') as f:
+        json.dump({"paper3": {"title": "External"}}, f)
+    first.papers_index["paper4"] = {"title": "Fourth"}
+    first._save_papers_index()
+    assert len(reads) == 1
+    assert set(first.papers_index) == {"paper1", "paper3", "paper4"}
+
+
 @pytest.mark.arxiv
 @pytest.mark.asyncio
 async def test_arxiv_search_papers_enhanced():
@@ -123,225 +265,310 @@ async def test_arxiv_search_papers_empty_query():
 async def test_arxiv_download_paper_real(mcp_client):
     """Test downloading a real arXiv paper."""
     # Use the storage path from our test client
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        args = {
-            "paper_id": "1706.03762"  # Attention Is All You Need
-        }
-        
-        result = await arxiv_download_paper(args)
-        
-        assert result["success"] is True
-        assert result["paper_id"] == "1706.03762"
-        assert "local_path" in result
-        assert "metadata_path" in result
-        assert "file_size" in result
-        assert result["file_size"] > 0
-        
-        # Verify files were created
-        paper_file = Path(result["local_path"])
-        metadata_file = Path(result["metadata_path"])
-        assert paper_file.exists()
-        assert metadata_file.exists()
-        
-        # Verify metadata content
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
-        assert metadata["id"] == "1706.03762"
-        assert "attention" in metadata["title"].lower()
+    args = {
+        "paper_id": "1706.03762"  # Attention Is All You Need
+    }
+    
+    result = await arxiv_download_paper(args)
+    
+    assert result["success"] is True
+    assert result["paper_id"] == "1706.03762"
+    assert "local_path" in result
+    assert "metadata_path" in result
+    assert "file_size" in result
+    assert result["file_size"] > 0
+    
+    # Verify files were created
+    paper_file = Path(result["local_path"])
+    metadata_file = Path(result["metadata_path"])
+    assert paper_file.exists()
+    assert metadata_file.exists()
+    
+    # Verify metadata content
+    with open(metadata_file, 'r') as f:
+        metadata = json.load(f)
+    assert metadata["id"] == "1706.03762"
+    assert "attention" in metadata["title"].lower()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_arxiv_download_paper_already_exists(mcp_client):
     """Test downloading when paper already exists."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        paper_id = "test.paper"
+    paper_id = "test.paper"
+    
+    # Create fake existing file
+    paper_file = mcp_client._get_paper_file_path(paper_id)
+    paper_file.write_text("fake pdf content")
+    
+    args = {"paper_id": paper_id}
+    result = await arxiv_download_paper(args)
+    
+    assert result["success"] is True
+    assert result["status"] == "already_downloaded"
+    assert result["paper_id"] == paper_id
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_arxiv_download_paper_force_redownload(mcp_client):
+    """Test force re-download of existing paper."""
+    paper_id = "1706.03762"
+    
+    # Create fake existing file
+    paper_file = mcp_client._get_paper_file_path(paper_id)
+    paper_file.write_text("old content")
+    
+    with patch('src.tools.arxiv_client_mcp._async_arxiv_search') as mock_search, \
+         patch('src.tools.arxiv_client_mcp.requests.get') as mock_get:
+        
+        async def mock_async_search(search):
+            yield FAKE_ATTENTION_RESULT
+        mock_search.side_effect = mock_async_search
+        
+        # Stub HTTP response
+        mock_get.return_value = SimpleNamespace(
+            content=b"new pdf content",
+            iter_content=lambda *a, **k: [b"new pdf content"],
+            raise_for_status=lambda: None
+        )
         
-        # Create fake existing file
-        paper_file = mcp_client._get_paper_file_path(paper_id)
-        paper_file.write_text("fake pdf content")
+        args = {
+            "paper_id": paper_id,
+            "force_download": True
+        }
         
-        args = {"paper_id": paper_id}
         result = await arxiv_download_paper(args)
         
         assert result["success"] is True
-        assert result["status"] == "already_downloaded"
-        assert result["paper_id"] == paper_id
+        assert result["status"] == "downloaded"
+
+
+# Minimal stdio JSON-RPC server: answers each request from its own thread after
+# a delay, so replies arrive out of order, and interleaves a notification and a
+# stale response before each real answer. Downloads report how many requests
+# the server was holding when they arrived; "bad.paper" fails.
+_FAKE_MCP_SERVER = r"""
+import json, sys, threading, time
+lock = threading.Lock()
+in_flight = 0
+
+def send(msg):
+    with lock:
+        print(json.dumps(msg), flush=True)
+
+def answer(msg, seen):
+    global in_flight
+    if msg["method"] == "initialize":
+        reply = {"result": {}}
+    elif msg["params"]["arguments"]["paper_id"] == "bad.paper":
+        reply = {"error": {"code": -32000, "message": "network error"}}
+    else:
+        time.sleep(0.05)
+        paper_id = msg["params"]["arguments"]["paper_id"]
+        payload = {
+            "status": "downloaded",
+            "local_path": f"/papers/{paper_id}.pdf",
+            "metadata": {"in_flight": seen},
+        }
+        reply = {"result": {"content": [{"type": "text", "text": json.dumps(payload)}]}}
+    send({"jsonrpc": "2.0", "method": "notifications/progress"})
+    send({"jsonrpc": "2.0", "id": -1, "result": {}})
+    with lock:
+        in_flight -= 1
+    send({"jsonrpc": "2.0", "id": msg["id"], **reply})
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    if "id" not in msg:
+        continue
+    with lock:
+        in_flight += 1
+        seen = in_flight
+    threading.Thread(target=answer, args=(msg, seen)).start()
+"""
+
+
+@pytest.fixture
+async def fake_server_client(temp_storage, monkeypatch):
+    """MCP client talking to a fake stdio server, installed as the module client."""
+    client = ArxivMCPClient(storage_path=temp_storage)
+    client.server_process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", _FAKE_MCP_SERVER,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE
+    )
+    await client._initialize_server()
+    monkeypatch.setattr(arxiv_client_mcp, "mcp_client", client)
+    yield client
+    await client.stop_server()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_arxiv_download_paper_force_redownload(mcp_client):
-    """Test force re-download of existing paper."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        paper_id = "1706.03762"
-        
-        # Create fake existing file
-        paper_file = mcp_client._get_paper_file_path(paper_id)
-        paper_file.write_text("old content")
-        
-        with patch('src.tools.arxiv_client_mcp._async_arxiv_search') as mock_search, \
-             patch('src.tools.arxiv_client_mcp.requests.get') as mock_get:
-            
-            # Mock arXiv result
-            mock_result = Mock()
-            mock_result.entry_id = f"https://arxiv.org/abs/{paper_id}"
-            mock_result.title = "Test Paper"
-            mock_result.authors = [Mock(name="Test Author")]
-            mock_result.summary = "Test abstract"
-            mock_result.published = None
-            mock_result.updated = None
-            mock_result.categories = ["cs.AI"]
-            mock_result.primary_category = "cs.AI"
-            mock_result.pdf_url = f"https://arxiv.org/pdf/{paper_id}.pdf"
-            mock_result.doi = None
-            mock_result.journal_ref = None
-            mock_result.comment = None
-            
-            async def mock_async_search(search):
-                yield mock_result
-            mock_search.side_effect = mock_async_search
-            
-            # Mock HTTP response
-            mock_response = Mock()
-            mock_response.content = b"new pdf content"
-            mock_response.iter_content.return_value = [b"new pdf content"]
-            mock_get.return_value = mock_response
-            
-            args = {
-                "paper_id": paper_id,
-                "force_download": True
-            }
-            
-            result = await arxiv_download_paper(args)
-            
-            assert result["success"] is True
-            assert result["status"] == "downloaded"
+async def test_arxiv_download_papers_parallel(fake_server_client):
+    """Test bulk downloads overlap up to the limit and each get their own response."""
+    paper_ids = ["p1", "p2", "bad.paper", "p4", "p5", "p6", "p7"]
+    
+    result = await arxiv_download_papers({"paper_ids": paper_ids, "concurrency": 3})
+    
+    assert result["success"] is True
+    assert result["count"] == 7
+    assert result["downloaded"] == 6
+    assert [r["paper_id"] for r in result["results"]] == paper_ids
+    assert result["results"][2]["success"] is False
+    for paper_id, outcome in zip(paper_ids, result["results"]):
+        if outcome["success"]:
+            assert outcome["local_path"] == f"/papers/{paper_id}.pdf"
+    
+    peak = max(
+        r["metadata"]["in_flight"] for r in result["results"] if r["success"]
+    )
+    assert 1 < peak <= 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_arxiv_download_papers_invalid_args():
+    """Test bulk download rejects non-list paper IDs and bad concurrency."""
+    result = await arxiv_download_papers({"paper_ids": "1706.03762"})
+    assert result["success"] is False
+    assert "must be a list" in result["error"]
+    
+    result = await arxiv_download_papers({"paper_ids": ["p1"], "concurrency": "many"})
+    assert result["success"] is False
+    assert "Invalid concurrency" in result["error"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_arxiv_download_papers_empty_list():
+    """Test bulk download with no paper IDs."""
+    result = await arxiv_download_papers({"paper_ids": []})
+    
+    assert result["success"] is False
+    assert "At least one paper ID is required" in result["error"]
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_arxiv_list_papers(mcp_client):
     """Test listing downloaded papers."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        # Add test papers to index
-        test_papers = {
-            "1706.03762": {
-                "title": "Attention Is All You Need",
-                "download_date": "2024-01-01T00:00:00",
-                "file_size": 1000000,
-                "categories": ["cs.CL", "cs.AI"]
-            },
-            "1810.04805": {
-                "title": "BERT Paper",
-                "download_date": "2024-01-02T00:00:00",
-                "file_size": 2000000,
-                "categories": ["cs.CL"]
-            }
+    # Add test papers to index
+    test_papers = {
+        "1706.03762": {
+            "title": "Attention Is All You Need",
+            "download_date": "2024-01-01T00:00:00",
+            "file_size": 1000000,
+            "categories": ["cs.CL", "cs.AI"]
+        },
+        "1810.04805": {
+            "title": "BERT Paper",
+            "download_date": "2024-01-02T00:00:00",
+            "file_size": 2000000,
+            "categories": ["cs.CL"]
         }
-        
-        mcp_client.papers_index = test_papers
-        
-        # Create metadata files
-        for paper_id, data in test_papers.items():
-            metadata_file = mcp_client._get_metadata_file_path(paper_id)
-            with open(metadata_file, 'w') as f:
-                json.dump({"id": paper_id, "title": data["title"]}, f)
-        
-        args = {}
-        result = await arxiv_list_papers(args)
-        
-        assert result["success"] is True
-        assert len(result["papers"]) == 2
-        assert result["total_downloaded"] == 2
-        
-        # Check paper structure
-        paper = result["papers"][0]
-        assert "id" in paper
-        assert "title" in paper
-        assert "download_date" in paper
-        assert "file_size" in paper
-        assert "categories" in paper
-        assert "local_path" in paper
-        assert "metadata_available" in paper
+    }
+    
+    mcp_client.papers_index = test_papers
+    
+    # Create metadata files
+    for paper_id, data in test_papers.items():
+        metadata_file = mcp_client._get_metadata_file_path(paper_id)
+        with open(metadata_file, 'w') as f:
+            json.dump({"id": paper_id, "title": data["title"]}, f)
+    
+    args = {}
+    result = await arxiv_list_papers(args)
+    
+    assert result["success"] is True
+    assert len(result["papers"]) == 2
+    assert result["total_downloaded"] == 2
+    
+    # Check paper structure
+    paper = result["papers"][0]
+    assert "id" in paper
+    assert "title" in paper
+    assert "download_date" in paper
+    assert "file_size" in paper
+    assert "categories" in paper
+    assert "local_path" in paper
+    assert "metadata_available" in paper
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_arxiv_list_papers_with_filters(mcp_client):
     """Test listing papers with category filter."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        test_papers = {
-            "ai_paper": {
-                "title": "AI Paper",
-                "download_date": "2024-01-01T00:00:00",
-                "file_size": 1000000,
-                "categories": ["cs.AI"]
-            },
-            "ml_paper": {
-                "title": "ML Paper", 
-                "download_date": "2024-01-02T00:00:00",
-                "file_size": 2000000,
-                "categories": ["cs.LG"]
-            }
+    test_papers = {
+        "ai_paper": {
+            "title": "AI Paper",
+            "download_date": "2024-01-01T00:00:00",
+            "file_size": 1000000,
+            "categories": ["cs.AI"]
+        },
+        "ml_paper": {
+            "title": "ML Paper", 
+            "download_date": "2024-01-02T00:00:00",
+            "file_size": 2000000,
+            "categories": ["cs.LG"]
         }
-        
-        mcp_client.papers_index = test_papers
-        
-        args = {"category_filter": "cs.AI"}
-        result = await arxiv_list_papers(args)
-        
-        assert result["success"] is True
-        assert len(result["papers"]) == 1
-        assert result["papers"][0]["id"] == "ai_paper"
+    }
+    
+    mcp_client.papers_index = test_papers
+    
+    args = {"category_filter": "cs.AI"}
+    result = await arxiv_list_papers(args)
+    
+    assert result["success"] is True
+    assert len(result["papers"]) == 1
+    assert result["papers"][0]["id"] == "ai_paper"
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_arxiv_read_paper(mcp_client):
     """Test reading a downloaded paper."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        paper_id = "test.paper"
-        
-        # Create fake paper file and metadata
-        paper_file = mcp_client._get_paper_file_path(paper_id)
-        paper_file.write_text("fake pdf content")
-        
-        metadata_file = mcp_client._get_metadata_file_path(paper_id)
-        metadata = {
-            "id": paper_id,
-            "title": "Test Paper",
-            "authors": [{"name": "Test Author"}]
-        }
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f)
-        
-        args = {
-            "paper_id": paper_id,
-            "include_metadata": True
-        }
-        
-        result = await arxiv_read_paper(args)
-        
-        assert result["success"] is True
-        assert result["paper_id"] == paper_id
-        assert "local_path" in result
-        assert "file_size" in result
-        assert "metadata" in result
-        assert result["metadata"]["title"] == "Test Paper"
+    paper_id = "test.paper"
+    
+    # Create fake paper file and metadata
+    paper_file = mcp_client._get_paper_file_path(paper_id)
+    paper_file.write_text("fake pdf content")
+    
+    metadata_file = mcp_client._get_metadata_file_path(paper_id)
+    metadata = {
+        "id": paper_id,
+        "title": "Test Paper",
+        "authors": [{"name": "Test Author"}]
+    }
+    with open(metadata_file, 'w') as f:
+        json.dump(metadata, f)
+    
+    args = {
+        "paper_id": paper_id,
+        "include_metadata": True
+    }
+    
+    result = await arxiv_read_paper(args)
+    
+    assert result["success"] is True
+    assert result["paper_id"] == paper_id
+    assert "local_path" in result
+    assert "file_size" in result
+    assert "metadata" in result
+    assert result["metadata"]["title"] == "Test Paper"
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_arxiv_read_paper_not_found(mcp_client):
     """Test reading non-existent paper."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        args = {"paper_id": "nonexistent.paper"}
-        
-        result = await arxiv_read_paper(args)
-        
-        assert result["success"] is False
-        assert "not found locally" in result["error"]
+    args = {"paper_id": "nonexistent.paper"}
+    
+    result = await arxiv_read_paper(args)
+    
+    assert result["success"] is False
+    assert "not found locally" in result["error"]
 
 
 
@@ -350,67 +577,65 @@ async def test_arxiv_read_paper_not_found(mcp_client):
 @pytest.mark.asyncio
 async def test_arxiv_get_paper_metadata_local_cache(mcp_client):
     """Test getting metadata from local cache."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        paper_id = "test.paper"
-        
-        # Create cached metadata
-        metadata_file = mcp_client._get_metadata_file_path(paper_id)
-        cached_metadata = {
-            "id": paper_id,
-            "title": "Cached Paper",
-            "authors": [{"name": "Cached Author"}]
-        }
-        with open(metadata_file, 'w') as f:
-            json.dump(cached_metadata, f)
-        
-        args = {
-            "paper_id": paper_id,
-            "force_refresh": False
-        }
-        
-        result = await arxiv_get_paper_metadata(args)
-        
-        assert result["success"] is True
-        assert result["metadata"]["title"] == "Cached Paper"
-        assert "local_storage" in result["metadata"]
+    paper_id = "test.paper"
+    
+    # Create cached metadata
+    metadata_file = mcp_client._get_metadata_file_path(paper_id)
+    cached_metadata = {
+        "id": paper_id,
+        "title": "Cached Paper",
+        "authors": [{"name": "Cached Author"}]
+    }
+    with open(metadata_file, 'w') as f:
+        json.dump(cached_metadata, f)
+    
+    args = {
+        "paper_id": paper_id,
+        "force_refresh": False
+    }
+    
+    result = await arxiv_get_paper_metadata(args)
+    
+    assert result["success"] is True
+    assert result["metadata"]["title"] == "Cached Paper"
+    assert "local_storage" in result["metadata"]
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_arxiv_get_paper_metadata_with_citations(mcp_client):
     """Test getting metadata with citation analysis."""
-    with patch('src.tools.arxiv_client_mcp.mcp_client', mcp_client):
-        paper_id = "test.paper"
-        
-        # Create metadata with abstract containing citations
-        metadata_file = mcp_client._get_metadata_file_path(paper_id)
-        cached_metadata = {
-            "id": paper_id,
-            "title": "Test Paper",
-            "abstract": "This builds on work by Smith et al. (2020) and Jones et al. (2021)."
+    paper_id = "test.paper"
+    
+    # Create metadata with abstract containing citations
+    metadata_file = mcp_client._get_metadata_file_path(paper_id)
+    cached_metadata = {
+        "id": paper_id,
+        "title": "Test Paper",
+        "abstract": "This builds on work by Smith et al. (2020) and Jones et al. (2021)."
+    }
+    with open(metadata_file, 'w') as f:
+        json.dump(cached_metadata, f)
+    
+    # Mock the extract_citations import
+    async def mock_extract_citations(args):
+        return {
+            "success": True,
+            "citations": [{"author": "Smith", "year": "2020"}],
+            "count": 1
+        }
+    
+    with patch('src.tools.arxiv_client_mcp.extract_citations', mock_extract_citations):
+        args = {
+            "paper_id": paper_id,
+            "include_citations": True
         }
-        with open(metadata_file, 'w') as f:
-            json.dump(cached_metadata, f)
         
-        # Mock the extract_citations import
-        async def mock_extract_citations(args):
-            return {
-                "success": True,
-                "citations": [{"author": "Smith", "year": "2020"}],
-                "count": 1
-            }
+        result = await arxiv_get_paper_metadata(args)
         
-        with patch('src.tools.arxiv_client_mcp.extract_citations', mock_extract_citations):
-            args = {
-                "paper_id": paper_id,
-                "include_citations": True
-            }
-            
-            result = await arxiv_get_paper_metadata(args)
-            
-            assert result["success"] is True
-            assert "citations_in_abstract" in result["metadata"]
-            assert "citation_count" in result["metadata"]
+        assert result["success"] is True
+        assert "citations_in_abstract" in result["metadata"]
+        assert "citation_count" in result["metadata"]
 
 
 @pytest.mark.unit
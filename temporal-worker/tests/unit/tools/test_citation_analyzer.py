@@ -4,6 +4,7 @@ Tests citation extraction, network analysis, and pattern recognition.
 """
 
 import pytest
+from src.tools import citation_analyzer
 from src.tools.citation_analyzer import (
     extract_citations,
     analyze_citation_network,
@@ -11,7 +12,8 @@ from src.tools.citation_analyzer import (
     _simulate_citing_papers,
     _calculate_network_density,
     _find_central_papers,
-    _analyze_co_citations
+    _analyze_co_citations,
+    _known_author_matcher
 )
 
 
@@ -358,6 +360,32 @@ def test_analyze_co_citations():
         assert top_pair["shared_citations"] >= 1
 
 
+@pytest.mark.unit
+def test_analyze_co_citations_ties_and_repeated_edges():
+    """Test ties keep discovery order and repeated edges count every time."""
+    network = {
+        "edges": [
+            {"source": "zeta", "target": "first_cited"},
+            {"source": "omega", "target": "first_cited"},
+            {"source": "alpha", "target": "second_cited"},
+            {"source": "beta", "target": "second_cited"},
+            {"source": "alpha", "target": "second_cited"}
+        ]
+    }
+    
+    co_citations = _analyze_co_citations(network)
+    
+    assert co_citations["co_citation_pairs"] == 3
+    assert co_citations["strongest_co_citations"] == [
+        {"papers": ["alpha", "beta"], "shared_citations": 2,
+         "shared_papers": ["second_cited", "second_cited"]},
+        {"papers": ["omega", "zeta"], "shared_citations": 1,
+         "shared_papers": ["first_cited"]},
+        {"papers": ["alpha", "alpha"], "shared_citations": 1,
+         "shared_papers": ["second_cited"]}
+    ]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_citation_extraction_edge_cases():
@@ -384,6 +412,92 @@ async def test_citation_extraction_edge_cases():
     assert any(c["reference_number"] == "100" for c in numbered_citations)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_citations_adjacent_doi():
+    """Test a DOI does not hide a citation that directly follows it."""
+    args = {"paper_text": "See doi:10.1145/abc,arXiv:2101.00001; (doi:10.1000/xyz)[7]."}
+    result = await extract_citations(args)
+    
+    assert result["success"] is True
+    citations = result["citations"]
+    by_type = {}
+    for citation in citations:
+        by_type.setdefault(citation["type"], []).append(citation)
+    # DOIs still run to the next whitespace, as they always have
+    assert [c["doi"] for c in by_type["doi"]] == [
+        "10.1145/abc,arXiv:2101.00001;", "10.1000/xyz)[7]."
+    ]
+    assert [c["arxiv_id"] for c in by_type["arxiv"]] == ["2101.00001"]
+    assert [c["reference_number"] for c in by_type["numbered"]] == ["7"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_citations_parenthesized_doi():
+    """Test DOIs containing parentheses are extracted whole."""
+    args = {
+        "paper_text": (
+            "Outbreak report doi:10.1016/S0140-6736(20)30183-5 and the biomaterials "
+            "study DOI: 10.1002/(SICI)1097-4636(199706)35:4<447::AID-JBM5>3.0.CO;2-F "
+            "were both cited [3]."
+        )
+    }
+    result = await extract_citations(args)
+    
+    assert result["success"] is True
+    dois = [c["doi"] for c in result["citations"] if c["type"] == "doi"]
+    assert dois == [
+        "10.1016/S0140-6736(20)30183-5",
+        "10.1002/(SICI)1097-4636(199706)35:4<447::AID-JBM5>3.0.CO;2-F",
+    ]
+    assert any(c.get("reference_number") == "3" for c in result["citations"])
+
+
+@pytest.fixture(params=["ahocorasick", "regex"])
+def known_author_backend(request, monkeypatch):
+    """Run known-author detection on each matcher backend."""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(citation_analyzer, "ahocorasick", None)
+    _known_author_matcher.cache_clear()
+    yield request.param
+    _known_author_matcher.cache_clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_citations_known_author_automaton(known_author_backend):
+    """Test known-author detection matches whole names in order of mention."""
+    args = {
+        "paper_text": "See (González-López et al., 2022), then O'Connor and Lin (2021).",
+        "known_authors": ["O'Connor", "González-López", "Li", "Vaswani"]
+    }
+    
+    result = await extract_citations(args)
+    
+    assert result["success"] is True
+    assert result["known_authors_found"] == ["González-López", "O'Connor"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_citations_known_author_overlaps(known_author_backend):
+    """Test nested and overlapping known names are all reported."""
+    args = {
+        "paper_text": "Following John Smith (2020) and Mary Ann Lee (2019).",
+        "known_authors": ["Smith", "John Smith", "John", "Ann Lee", "Mary Ann"]
+    }
+    
+    result = await extract_citations(args)
+    
+    assert result["success"] is True
+    assert result["known_authors_found"] == [
+        "John Smith", "John", "Smith", "Mary Ann", "Ann Lee"
+    ]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_citation_network_with_depth():
@@ -4,8 +4,9 @@ Tests PDF content extraction, section parsing, and text processing.
 """
 
 import pytest
-from unittest.mock import patch, Mock, MagicMock
 import io
+import requests
+from types import SimpleNamespace
 from src.tools.pdf_processor import (
     process_pdf_content,
     extract_paper_sections,
@@ -14,6 +15,11 @@ from src.tools.pdf_processor import (
 )
 
 
+def _resp(content: bytes) -> SimpleNamespace:
+    """Stand-in for a successful requests.Response carrying PDF bytes."""
+    return SimpleNamespace(content=content, raise_for_status=lambda: None)
+
+
 # Sample academic paper text for section extraction
 SAMPLE_ACADEMIC_TEXT = """
 Title: Deep Learning Applications in Computer Vision
@@ -48,11 +54,24 @@ References
 """
 
 
+@pytest.fixture(scope="module")
+def parsed_sample_sections():
+    """SAMPLE_ACADEMIC_TEXT parsed once for tests that only check structure."""
+    return _extract_paper_sections(
+        SAMPLE_ACADEMIC_TEXT,
+        ["abstract", "introduction", "methodology", "results", "conclusion", "references"]
+    )
+
+
 @pytest.mark.slow
 @pytest.mark.arxiv
 @pytest.mark.asyncio
-async def test_process_pdf_content_real_arxiv_paper():
+async def test_process_pdf_content_real_arxiv_paper(arxiv_attention_pdf, monkeypatch):
     """Test PDF processing with a real arXiv paper."""
+    monkeypatch.setattr(
+        "src.tools.pdf_processor.requests.get",
+        lambda *a, **k: _resp(arxiv_attention_pdf)
+    )
     args = {
         "pdf_url": "https://arxiv.org/pdf/1706.03762.pdf",  # Attention Is All You Need
         "include_metadata": True
@@ -75,8 +94,7 @@ async def test_process_pdf_content_real_arxiv_paper():
     
     # Check for common sections in academic papers
     sections = content["sections"]
-    section_names = list(sections.keys())
-    assert any("abstract" in name.lower() for name in section_names)
+    assert any("abstract" in name.lower() for name in sections)
     
     # Verify processing metadata
     assert "processing_metadata" in result
@@ -104,10 +122,15 @@ async def test_process_pdf_content_empty_url():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_pdf_content_invalid_url():
+async def test_process_pdf_content_invalid_url(monkeypatch):
     """Test PDF processing with invalid URL."""
+    def unreachable(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("nodename nor servname provided")
+    
+    # Fail like an unresolvable host, without waiting on a real DNS lookup
+    monkeypatch.setattr("src.tools.pdf_processor.requests.get", unreachable)
     args = {
-        "pdf_url": "https://invalid-url-that-does-not-exist.com/paper.pdf"
+        "pdf_url": "https://example.invalid/paper.pdf"
     }
     
     result = await process_pdf_content(args)
@@ -119,43 +142,61 @@ async def test_process_pdf_content_invalid_url():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_pdf_content_mocked():
+async def test_process_pdf_content_mocked(fake_pdf_factory, monkeypatch):
     """Test PDF processing with mocked dependencies."""
-    # Mock response content
-    mock_response = Mock()
-    mock_response.content = b"fake pdf content"
-    mock_response.raise_for_status.return_value = None
-    
-    # Mock PDF object
-    mock_page = Mock()
-    mock_page.extract_text.return_value = "Sample extracted text from page"
-    
-    mock_pdf = Mock()
-    mock_pdf.pages = [mock_page, mock_page]  # Two pages
-    mock_pdf.metadata = {
-        "Title": "Test Paper",
-        "Author": "Test Author",
-        "Subject": "Test Subject"
-    }
-    mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-    mock_pdf.__exit__ = Mock(return_value=None)
-    
-    with patch('src.tools.pdf_processor.requests.get', return_value=mock_response), \
-         patch('src.tools.pdf_processor.pdfplumber.open', return_value=mock_pdf):
-        
-        args = {
-            "pdf_url": "https://example.com/test.pdf",
-            "include_metadata": True
+    # Two-page fake PDF
+    mock_pdf = fake_pdf_factory(
+        "Sample extracted text from page",
+        pages=2,
+        metadata={
+            "Title": "Test Paper",
+            "Author": "Test Author",
+            "Subject": "Test Subject"
         }
-        
-        result = await process_pdf_content(args)
-        
-        assert result["success"] is True
-        content = result["content"]
-        
-        assert "Sample extracted text from page" in content["full_text"]
-        assert len(content["pages"]) == 2
-        assert content["metadata"]["title"] == "Test Paper"
+    )
+    monkeypatch.setattr(
+        "src.tools.pdf_processor.requests.get",
+        lambda *a, **k: _resp(b"fake pdf content")
+    )
+    monkeypatch.setattr("src.tools.pdf_processor.pdfplumber.open", lambda *a, **k: mock_pdf)
+    
+    args = {
+        "pdf_url": "https://example.com/test.pdf",
+        "include_metadata": True
+    }
+    
+    result = await process_pdf_content(args)
+    
+    assert result["success"] is True
+    content = result["content"]
+    
+    assert "Sample extracted text from page" in content["full_text"]
+    assert len(content["pages"]) == 2
+    assert content["metadata"]["title"] == "Test Paper"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_pdf_content_text_only(fake_pdf_factory, monkeypatch):
+    """Test that metadata and sections are skipped when not wanted."""
+    mock_pdf = fake_pdf_factory(SAMPLE_ACADEMIC_TEXT, metadata={"Title": "Test Paper"})
+    monkeypatch.setattr(
+        "src.tools.pdf_processor.requests.get",
+        lambda *a, **k: _resp(b"fake pdf content")
+    )
+    monkeypatch.setattr("src.tools.pdf_processor.pdfplumber.open", lambda *a, **k: mock_pdf)
+    
+    result = await process_pdf_content({
+        "pdf_url": "https://example.com/test.pdf",
+        "sections": False,
+        "include_metadata": False
+    })
+    
+    assert result["success"] is True
+    content = result["content"]
+    assert content["full_text"]
+    assert content["metadata"] == {}
+    assert content["sections"] == {}
 
 
 @pytest.mark.unit
@@ -359,38 +400,29 @@ def test_clean_extracted_text():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_pdf_content_custom_sections():
+async def test_process_pdf_content_custom_sections(fake_pdf_factory, monkeypatch, parsed_sample_sections):
     """Test PDF processing with custom section list."""
-    mock_response = Mock()
-    mock_response.content = b"fake pdf content"
-    mock_response.raise_for_status.return_value = None
-    
-    mock_page = Mock()
-    mock_page.extract_text.return_value = SAMPLE_ACADEMIC_TEXT
-    
-    mock_pdf = Mock()
-    mock_pdf.pages = [mock_page]
-    mock_pdf.metadata = {}
-    mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-    mock_pdf.__exit__ = Mock(return_value=None)
-    
-    with patch('src.tools.pdf_processor.requests.get', return_value=mock_response), \
-         patch('src.tools.pdf_processor.pdfplumber.open', return_value=mock_pdf):
-        
-        args = {
-            "pdf_url": "https://example.com/test.pdf",
-            "sections": ["abstract", "introduction", "conclusion"]
-        }
-        
-        result = await process_pdf_content(args)
-        
-        assert result["success"] is True
-        sections = result["content"]["sections"]
-        
-        # Should only extract requested sections
-        section_names = list(sections.keys())
-        for name in section_names:
-            assert name in ["abstract", "introduction", "conclusion"]
+    mock_pdf = fake_pdf_factory(SAMPLE_ACADEMIC_TEXT)
+    monkeypatch.setattr(
+        "src.tools.pdf_processor.requests.get",
+        lambda *a, **k: _resp(b"fake pdf content")
+    )
+    monkeypatch.setattr("src.tools.pdf_processor.pdfplumber.open", lambda *a, **k: mock_pdf)
+    
+    args = {
+        "pdf_url": "https://example.com/test.pdf",
+        "sections": ["abstract", "introduction", "conclusion"]
+    }
+    
+    result = await process_pdf_content(args)
+    
+    assert result["success"] is True
+    sections = result["content"]["sections"]
+    
+    # Should only extract requested sections, under the same headers as a full parse
+    assert sections.keys() <= {"abstract", "introduction", "conclusion"}
+    for name, section in sections.items():
+        assert section["header"] == parsed_sample_sections[name]["header"]
 
 
 @pytest.mark.unit
@@ -472,8 +504,12 @@ Methodology subsection.
 @pytest.mark.slow
 @pytest.mark.arxiv
 @pytest.mark.asyncio
-async def test_process_pdf_content_timeout_handling():
+async def test_process_pdf_content_timeout_handling(arxiv_attention_pdf, monkeypatch):
     """Test PDF processing with timeout scenarios."""
+    monkeypatch.setattr(
+        "src.tools.pdf_processor.requests.get",
+        lambda *a, **k: _resp(arxiv_attention_pdf)
+    )
     args = {
         "pdf_url": "https://arxiv.org/pdf/1706.03762.pdf",
         "include_metadata": False  # Faster processing
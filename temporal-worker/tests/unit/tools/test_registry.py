@@ -186,9 +186,6 @@ def test_register_new_tool():
     assert "dummy_tool" in TOOL_DESCRIPTIONS
     assert TOOL_REGISTRY["dummy_tool"] == dummy_tool
     assert TOOL_DESCRIPTIONS["dummy_tool"] == tool_description
-    
-    # Clean up
-    unregister_tool("dummy_tool")
 
 
 @pytest.mark.unit
@@ -256,29 +253,35 @@ async def test_validate_tool_usage_optional_args():
     assert result_optional["valid"] is True
 
 
+# (tool_name, args, expected_valid) for test_validate_multiple_tools
+_MULTI_TOOL_CASES = [
+    # Enhanced arXiv tools
+    ("arxiv_search_papers", {"query": "test"}, True),
+    ("arxiv_download_paper", {"paper_id": "1234.5678"}, True),
+    ("arxiv_list_papers", {}, True),  # No required args
+    ("arxiv_read_paper", {"paper_id": "1234.5678"}, True),
+    ("arxiv_get_metadata", {"paper_id": "1234.5678"}, True),
+    # Other tools
+    ("extract_citations", {"paper_text": "sample text"}, True),
+    ("process_pdf", {"pdf_url": "https://example.com/paper.pdf"}, True),
+    ("find_similar_papers", {"reference_paper": "sample text"}, True),
+    ("calculate_similarity", {"paper1_text": "text1", "paper2_text": "text2"}, True),
+    ("analyze_citation_network", {"paper_ids": ["paper1", "paper2"]}, True),
+    ("extract_sections", {"paper_text": "text", "sections": ["abstract"]}, True)
+]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_validate_multiple_tools():
+@pytest.mark.parametrize(
+    "tool_name,args,expected_valid",
+    _MULTI_TOOL_CASES,
+    ids=[tool_name for tool_name, _, _ in _MULTI_TOOL_CASES]
+)
+async def test_validate_multiple_tools(tool_name, args, expected_valid):
     """Test validation for multiple different tools."""
-    test_cases = [
-        # Enhanced arXiv tools
-        ("arxiv_search_papers", {"query": "test"}, True),
-        ("arxiv_download_paper", {"paper_id": "1234.5678"}, True),
-        ("arxiv_list_papers", {}, True),  # No required args
-        ("arxiv_read_paper", {"paper_id": "1234.5678"}, True),
-        ("arxiv_get_metadata", {"paper_id": "1234.5678"}, True),
-        # Other tools
-        ("extract_citations", {"paper_text": "sample text"}, True),
-        ("process_pdf", {"pdf_url": "https://example.com/paper.pdf"}, True),
-        ("find_similar_papers", {"reference_paper": "sample text"}, True),
-        ("calculate_similarity", {"paper1_text": "text1", "paper2_text": "text2"}, True),
-        ("analyze_citation_network", {"paper_ids": ["paper1", "paper2"]}, True),
-        ("extract_sections", {"paper_text": "text", "sections": ["abstract"]}, True)
-    ]
-    
-    for tool_name, args, expected_valid in test_cases:
-        result = await validate_tool_usage(tool_name, args)
-        assert result["valid"] == expected_valid, f"Tool {tool_name} validation failed"
+    result = await validate_tool_usage(tool_name, args)
+    assert result["valid"] == expected_valid, f"Tool {tool_name} validation failed"
 
 
 @pytest.mark.unit
@@ -318,20 +321,16 @@ async def test_validate_tool_with_complex_args():
 
 
 @pytest.mark.unit
-def test_registry_immutability_during_validation():
+@pytest.mark.asyncio
+async def test_registry_immutability_during_validation():
     """Test that validation doesn't modify the registry."""
     original_registry = dict(TOOL_REGISTRY)
     original_descriptions = dict(TOOL_DESCRIPTIONS)
     
     # Perform various validations
-    import asyncio
-    
-    async def run_validations():
-        await validate_tool_usage("arxiv_search", {"query": "test"})
-        await validate_tool_usage("unknown_tool", {})
-        await validate_tool_usage("extract_citations", {})
-    
-    asyncio.run(run_validations())
+    await validate_tool_usage("arxiv_search", {"query": "test"})
+    await validate_tool_usage("unknown_tool", {})
+    await validate_tool_usage("extract_citations", {})
     
     # Registry should remain unchanged
     assert TOOL_REGISTRY == original_registry
@@ -340,36 +339,28 @@ def test_registry_immutability_during_validation():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_edge_case_validations():
-    """Test edge cases in tool validation."""
-    # Empty string arguments
-    result_empty_query = await validate_tool_usage("arxiv_search_papers", {"query": ""})
-    # Should be invalid since empty string doesn't pass our validation
-    assert result_empty_query["valid"] is False
-    
-    # None values
-    result_none = await validate_tool_usage("arxiv_search_papers", {"query": None})
-    # Should be invalid since None doesn't pass our validation
-    assert result_none["valid"] is False
-    
+@pytest.mark.parametrize("args,expected_valid", [
+    # Empty string arguments: invalid since empty string doesn't pass our validation
+    pytest.param({"query": ""}, False, id="empty_query"),
+    # None values: invalid since None doesn't pass our validation
+    pytest.param({"query": None}, False, id="none_query"),
     # Extra arguments (should be allowed)
-    result_extra = await validate_tool_usage("arxiv_search_papers", {
-        "query": "test",
-        "extra_arg": "should_be_ignored"
-    })
-    assert result_extra["valid"] is True
+    pytest.param({"query": "test", "extra_arg": "should_be_ignored"}, True, id="extra_arg"),
+])
+async def test_edge_case_validations(args, expected_valid):
+    """Test edge cases in tool validation."""
+    result = await validate_tool_usage("arxiv_search_papers", args)
+    assert result["valid"] is expected_valid
 
 
 @pytest.mark.unit
-def test_tool_handler_retrieval_consistency():
+@pytest.mark.parametrize("tool_name", list(TOOL_REGISTRY))
+def test_tool_handler_retrieval_consistency(tool_name):
     """Test that tool handlers can be consistently retrieved."""
-    tools = list(TOOL_REGISTRY.keys())
-    
-    for tool_name in tools:
-        handler = get_tool_handler(tool_name)
-        assert handler is not None
-        assert callable(handler)
-        assert handler == TOOL_REGISTRY[tool_name]
+    handler = get_tool_handler(tool_name)
+    assert handler is not None
+    assert callable(handler)
+    assert handler == TOOL_REGISTRY[tool_name]
 
 
 @pytest.mark.unit
@@ -380,7 +371,7 @@ async def test_description_format_consistency():
     
     for tool_name, desc in descriptions.items():
         # All should have the same top-level keys
-        assert set(desc.keys()) == {"description", "args", "returns"}
+        assert desc.keys() == {"description", "args", "returns"}
         
         # Description should be a meaningful string
         assert isinstance(desc["description"], str)
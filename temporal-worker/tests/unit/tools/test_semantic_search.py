@@ -3,7 +3,11 @@ Tests for semantic search tool with real similarity calculations.
 Tests paper similarity, semantic search, and NLP-based comparisons.
 """
 
+import random
+import string
+
 import pytest
+from src.tools import semantic_search
 from src.tools.semantic_search import (
     find_similar_papers,
     calculate_paper_similarity,
@@ -11,7 +15,11 @@ from src.tools.semantic_search import (
     _calculate_tfidf_similarity,
     _calculate_jaccard_similarity,
     _calculate_word_overlap,
-    _get_sample_corpus
+    _get_sample_corpus,
+    _build_corpus_index,
+    _search_corpus_index,
+    _env_int,
+    _INDEX_MIN_CORPUS
 )
 
 
@@ -138,6 +146,27 @@ async def test_find_similar_papers_empty_corpus():
     assert len(result["similar_papers"]) > 0
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_find_similar_papers_empty_corpus_matches_sample_corpus():
+    """Test the cached sample-corpus search scores like passing the corpus in."""
+    args = {
+        "reference_paper": TRANSFORMER_ABSTRACT,
+        "search_corpus": [],
+        "similarity_threshold": 0.0
+    }
+    
+    result = await find_similar_papers(args)
+    explicit = await find_similar_papers({**args, "search_corpus": _get_sample_corpus()})
+    
+    assert result["success"] is True
+    assert len(result["similar_papers"]) > 0
+    cached_ids = [p["id"] for p in result["similar_papers"]]
+    assert cached_ids == [p["id"] for p in explicit["similar_papers"]]
+    for cached, fitted in zip(result["similar_papers"], explicit["similar_papers"]):
+        assert cached["similarity_score"] == pytest.approx(fitted["similarity_score"])
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_calculate_paper_similarity_tfidf():
@@ -419,6 +448,127 @@ async def test_find_similar_papers_real_similarity_ranking():
         assert climate_paper["similarity_score"] < similar_papers[0]["similarity_score"]
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_find_similar_papers_large_corpus_index():
+    """Test that large corpora are searched through the cached corpus index."""
+    filler = [COMPUTER_VISION_ABSTRACT, UNRELATED_ABSTRACT]
+    test_corpus = [
+        {"id": f"filler_{i}", "text": f"{filler[i % 2]} variant{chr(97 + i % 26)}"}
+        for i in range(_INDEX_MIN_CORPUS)
+    ]
+    test_corpus.append({"id": "bert", "text": BERT_ABSTRACT})
+    
+    args = {
+        "reference_paper": TRANSFORMER_ABSTRACT,
+        "search_corpus": test_corpus,
+        "max_results": 5,
+        "similarity_threshold": 0.0
+    }
+    
+    _build_corpus_index.cache_clear()
+    result = await find_similar_papers(args)
+    repeat = await find_similar_papers(args)
+    
+    assert result["success"] is True
+    similar_papers = result["similar_papers"]
+    assert len(similar_papers) == 5
+    assert similar_papers[0]["id"] == "bert"
+    assert [p["similarity_rank"] for p in similar_papers] == [1, 2, 3, 4, 5]
+    for i in range(len(similar_papers) - 1):
+        assert similar_papers[i]["similarity_score"] >= similar_papers[i + 1]["similarity_score"]
+    
+    # Second search reuses the fitted corpus
+    assert repeat["similar_papers"] == similar_papers
+    assert _build_corpus_index.cache_info().hits == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_find_similar_papers_index_matches_joint_fit(monkeypatch):
+    """Test the cached index scores exactly like fitting the reference with the corpus."""
+    filler = [BERT_ABSTRACT, COMPUTER_VISION_ABSTRACT, UNRELATED_ABSTRACT]
+    test_corpus = [
+        {"id": f"paper_{i}", "text": f"{filler[i % 3]} variant{chr(97 + i % 26)}"}
+        for i in range(_INDEX_MIN_CORPUS)
+    ]
+    
+    # Most of the reference's terms never occur in the corpus
+    args = {
+        "reference_paper": TRANSFORMER_ABSTRACT,
+        "search_corpus": test_corpus,
+        "max_results": None,
+        "similarity_threshold": 0.0
+    }
+    
+    indexed = await find_similar_papers(args)
+    monkeypatch.setattr(semantic_search, "_INDEX_MIN_CORPUS", len(test_corpus) + 1)
+    joint = await find_similar_papers(args)
+    
+    assert indexed["success"] is True and joint["success"] is True
+    # Near-duplicate fillers tie, so compare scores per paper rather than order
+    indexed_scores = {p["id"]: p["similarity_score"] for p in indexed["similar_papers"]}
+    joint_scores = {p["id"]: p["similarity_score"] for p in joint["similar_papers"]}
+    assert indexed_scores == pytest.approx(joint_scores)
+    assert indexed["similar_papers"][0]["id"] == "paper_0"  # BERT filler
+
+
+@pytest.mark.unit
+def test_corpus_index_matches_tfidf_fit_transform():
+    """Test index scores equal a TfidfVectorizer fit through max_df and max_features."""
+    rng = random.Random(0)
+    # Letter-only nonsense words, so preprocessing and stop words leave them be
+    letters = string.ascii_lowercase
+    words = ["zq" + a + b for a in letters for b in letters]
+    corpus_texts = []
+    for i in range(40):
+        doc = rng.choices(words[:400], k=120)
+        # "ubiquon" is in every document and the reference, "corpon" in every
+        # corpus document: both exceed max_df. "majoron" stays just under it.
+        doc += ["ubiquon", "corpon"] + (["majoron"] if i < 37 else [])
+        corpus_texts.append(" ".join(doc))
+    # Random bigrams push the vocabulary far past max_features, with many terms
+    # tied at the cutoff frequency; the reference adds terms the corpus lacks
+    reference = " ".join(
+        rng.choices(words[:400], k=60) + rng.choices(words[400:], k=20)
+        + ["ubiquon", "majoron"]
+    )
+    
+    _build_corpus_index.cache_clear()
+    corpus_index = _build_corpus_index(tuple(corpus_texts))
+    indexed = dict(_search_corpus_index(
+        corpus_index, _preprocess_text(reference), len(corpus_texts)
+    ))
+    
+    vectorizer = semantic_search._corpus_vectorizer()
+    matrix = vectorizer.fit_transform(
+        [_preprocess_text(text) for text in [reference] + corpus_texts]
+    )
+    assert len(vectorizer.get_feature_names_out()) == vectorizer.max_features
+    assert "ubiquon" not in vectorizer.vocabulary_
+    assert "corpon" not in vectorizer.vocabulary_
+    assert "majoron" in vectorizer.vocabulary_
+    expected = (matrix[1:] @ matrix[0].T).toarray().ravel()
+    
+    assert [indexed[i] for i in range(len(corpus_texts))] == pytest.approx(
+        expected.tolist(), abs=1e-12
+    )
+
+
+@pytest.mark.unit
+def test_env_int_falls_back_on_invalid_values(monkeypatch, caplog):
+    """Test a malformed numeric setting logs a warning and keeps the default."""
+    monkeypatch.setenv("SEMANTIC_SEARCH_DENSE_MAX_NNZ", "lots")
+    assert _env_int("SEMANTIC_SEARCH_DENSE_MAX_NNZ", 50000) == 50000
+    assert "SEMANTIC_SEARCH_DENSE_MAX_NNZ" in caplog.text
+    
+    monkeypatch.setenv("SEMANTIC_SEARCH_DENSE_MAX_NNZ", "1000")
+    assert _env_int("SEMANTIC_SEARCH_DENSE_MAX_NNZ", 50000) == 1000
+    
+    monkeypatch.delenv("SEMANTIC_SEARCH_DENSE_MAX_NNZ")
+    assert _env_int("SEMANTIC_SEARCH_DENSE_MAX_NNZ", 50000) == 50000
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_similarity_metadata():